@@ -1,7 +1,7 @@
 """Alembic environment configuration for async migrations."""
 
 from logging.config import fileConfig
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
@@ -55,11 +55,17 @@ def do_run_migrations(connection: Connection) -> None:
     """Run migrations with connection."""
     context.configure(connection=connection, target_metadata=target_metadata)
 
+    # Share one Inspector across every revision in this run so its info_cache
+    # survives from one migration to the next instead of re-querying pg_catalog.
+    # The cache is not invalidated by DDL, so revisions must not re-read
+    # reflection data for objects altered earlier in the same run.
+    config.attributes["inspector"] = inspect(connection)
+
     with context.begin_transaction():
         context.run_migrations()
 
 
-async def run_migrations_online() -> None:
+async def run_async_migrations() -> None:
     """Run migrations in 'online' mode with async engine."""
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = settings.database_url
@@ -75,10 +81,19 @@ async def run_migrations_online() -> None:
     await connectable.dispose()
 
 
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode, reusing a caller-provided connection if any."""
+    connection = config.attributes.get("connection", None)
+    if connection is None:
+        import asyncio
+
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
+
+
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    import asyncio
-
-    asyncio.run(run_migrations_online())
+    run_migrations_online()
 
@@ -0,0 +1,50 @@
+"""add_dumapod_usage_bytes
+
+Revision ID: 2fa58cbcfaed
+Revises: 4e35381f395b
+Create Date: 2026-10-16 09:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2fa58cbcfaed'
+down_revision: Union[str, None] = '4e35381f395b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Running total of non-failed file bytes per pod, maintained by DumaStoredFileRepository
+    op.add_column('dumapods', sa.Column('usage_bytes', sa.BigInteger(), nullable=False, server_default='0'))
+    op.execute(
+        """
+        UPDATE dumapods SET usage_bytes = usage.total
+        FROM (
+            SELECT dumapod_id, SUM(file_size) AS total
+            FROM duma_stored_files
+            WHERE upload_status <> 'failed'
+            GROUP BY dumapod_id
+        ) AS usage
+        WHERE dumapods.id = usage.dumapod_id
+        """
+    )
+
+    # Covering partial index so per-pod aggregates over non-failed files are index-only scans
+    op.create_index(
+        'ix_duma_stored_files_active_usage',
+        'duma_stored_files',
+        ['dumapod_id'],
+        unique=False,
+        postgresql_where=sa.text("upload_status <> 'failed'"),
+        postgresql_include=['file_size'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_duma_stored_files_active_usage', table_name='duma_stored_files')
+    op.drop_column('dumapods', 'usage_bytes')
@@ -0,0 +1,59 @@
+"""ensure_pod_categories_name_index
+
+Revision ID: 5d83e0f1c6a2
+Revises: 9c41d7e2ab58
+Create Date: 2026-10-16 10:41:52.084617
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d83e0f1c6a2'
+down_revision: Union[str, None] = '9c41d7e2ab58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Set on the index when this revision creates it, so downgrade only drops
+# an index it owns and leaves one built earlier by create_all in place.
+_INDEX_MARKER = f"created by {revision}"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = context.config.attributes.get("inspector") or sa.inspect(conn)
+
+    # add_pod_category was generated empty, so the table may only exist where
+    # init_db ran create_all; create it here if missing.
+    if not inspector.has_table('pod_categories'):
+        op.create_table(
+            'pod_categories',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_pod_categories_id'), 'pod_categories', ['id'], unique=False)
+        indexes = set()
+    else:
+        indexes = {ix['name'] for ix in inspector.get_indexes('pod_categories')}
+
+    # Unique index backing name lookups and the uniqueness check on create
+    if 'ix_pod_categories_name' not in indexes:
+        op.create_index(op.f('ix_pod_categories_name'), 'pod_categories', ['name'], unique=True)
+        op.execute(f"COMMENT ON INDEX ix_pod_categories_name IS '{_INDEX_MARKER}'")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    marker = conn.execute(
+        sa.text("SELECT obj_description(to_regclass('ix_pod_categories_name'), 'pg_class')")
+    ).scalar()
+    if marker == _INDEX_MARKER:
+        op.drop_index(op.f('ix_pod_categories_name'), table_name='pod_categories')
@@ -0,0 +1,35 @@
+"""add_dumapod_listing_indexes
+
+Revision ID: 9c41d7e2ab58
+Revises: 2fa58cbcfaed
+Create Date: 2026-10-16 10:04:17.331902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41d7e2ab58'
+down_revision: Union[str, None] = '2fa58cbcfaed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Credentials are eager-loaded with WHERE dumapod_id IN (...)
+    op.create_index(op.f('ix_storage_credentials_dumapod_id'), 'storage_credentials', ['dumapod_id'], unique=False)
+    # Newest-first pod listing order
+    op.create_index(
+        'ix_dumapods_created_at_id',
+        'dumapods',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_dumapods_created_at_id', table_name='dumapods')
+    op.drop_index(op.f('ix_storage_credentials_dumapod_id'), table_name='storage_credentials')
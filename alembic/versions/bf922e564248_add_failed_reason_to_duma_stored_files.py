@@ -8,7 +8,6 @@ Create Date: 2026-01-21 10:46:03.418625
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
@@ -19,11 +18,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add failed_reason column to duma_stored_files table
-    op.add_column('duma_stored_files', sa.Column('failed_reason', sa.Text(), nullable=True))
+    # Add failed_reason column to duma_stored_files table (idempotent, no reflection)
+    op.execute("ALTER TABLE duma_stored_files ADD COLUMN IF NOT EXISTS failed_reason TEXT")
 
 
 def downgrade() -> None:
     # Remove failed_reason column from duma_stored_files table
-    op.drop_column('duma_stored_files', 'failed_reason')
+    op.execute("ALTER TABLE duma_stored_files DROP COLUMN IF EXISTS failed_reason")
 
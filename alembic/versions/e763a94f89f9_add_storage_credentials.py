@@ -7,7 +7,7 @@ Create Date: 2026-01-14 12:53:13.483042
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -17,10 +17,8 @@ down_revision: Union[str, None] = 'c19e862a5d9f'
 branch_labels: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    from sqlalchemy import inspect
-    
     conn = op.get_bind()
-    inspector = inspect(conn)
+    inspector = context.config.attributes.get("inspector") or sa.inspect(conn)
     tables = inspector.get_table_names()
     
     if 'storage_credentials' not in tables:
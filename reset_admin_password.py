@@ -6,28 +6,36 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.config.database import AsyncSessionLocal
+from src.config.database import get_script_session
 from src.repositories.user_repo import UserRepository
 from src.core.security import get_password_hash
 from src.models.user import User
-from sqlalchemy import select, update
+from sqlalchemy import update
 
 async def reset_password():
-    async with AsyncSessionLocal() as session:
+    async with get_script_session() as session:
         email = "admin@example.com"
         new_password = "admin123456"
-        hashed_password = get_password_hash(new_password)
-        
         print(f"Resetting password for {email}...")
-        
-        stmt = select(User).where(User.email == email)
+
+        # Hash on a worker thread while the session checks out its connection
+        hash_task = asyncio.create_task(asyncio.to_thread(get_password_hash, new_password))
+        await session.connection()
+        hashed_password = await hash_task
+
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(hashed_password=hashed_password)
+            .returning(User.id)
+            # Nothing is loaded in this session, so skip the identity-map sync
+            .execution_options(synchronize_session=False)
+        )
         result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
-        
-        if user:
-            user.hashed_password = hashed_password
-            session.add(user)
-            await session.commit()
+        user_id = result.scalar_one_or_none()
+        await session.commit()
+
+        if user_id is not None:
             print("Password reset successfully.")
         else:
             print("User not found.")
@@ -1,29 +1,16 @@
 import asyncio
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
-from src.config.settings import settings
+from src.config.database import get_dsn_pool, close_dsn_pool
 
 async def migrate():
-    # Use async engine since app is async configured
-    engine = create_async_engine(settings.database_url)
-    
-    async with engine.begin() as conn:
-        print("Checking if 'upload_status' column exists in 'duma_stored_files'...")
-        # Check if column exists
-        result = await conn.execute(text(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_name='duma_stored_files' AND column_name='upload_status';"
-        ))
-        if result.scalar():
-            print("Column 'upload_status' already exists.")
-        else:
-            print("Adding 'upload_status' column...")
-            await conn.execute(text(
-                "ALTER TABLE duma_stored_files ADD COLUMN upload_status VARCHAR DEFAULT 'pending';"
-            ))
-            print("Column added successfully.")
-
-    await engine.dispose()
+    # One-shot DDL on the shared raw asyncpg pool, no SQLAlchemy session needed
+    pool = await get_dsn_pool()
+    try:
+        await pool.execute(
+            "ALTER TABLE duma_stored_files ADD COLUMN IF NOT EXISTS upload_status VARCHAR DEFAULT 'pending';"
+        )
+        print("Column 'upload_status' is present.")
+    finally:
+        await close_dsn_pool()
 
 if __name__ == "__main__":
     asyncio.run(migrate())
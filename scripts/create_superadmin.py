@@ -7,41 +7,46 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.models.user import User, UserRole
 from src.core.security import get_password_hash
-from src.config.database import AsyncSessionLocal
-from sqlalchemy import select
+from src.config.database import get_script_session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-async def create_superadmin():
-    email = input("Enter Superadmin Email (default: superadmin@example.com): ").strip() or "superadmin@example.com"
-    full_name = input("Enter Full Name (default: Super Admin): ").strip() or "Super Admin"
-    password = input("Enter Password (default: secret123): ").strip() or "secret123"
+async def create_superadmin(email: str, full_name: str, password: str):
+    async with get_script_session() as session:
+        print(f"Creating superadmin: {email}")
+        # Hash on a worker thread while the session checks out its connection
+        hash_task = asyncio.create_task(asyncio.to_thread(get_password_hash, password))
+        await session.connection()
+        hashed_password = await hash_task
 
-    async with AsyncSessionLocal() as session:
-        # Check if user exists
-        stmt = select(User).where(User.email == email)
+        # Existence check and insert in one statement
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+                role=UserRole.SUPERADMIN,
+                is_active=True,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id)
+        )
         result = await session.execute(stmt)
-        existing_user = result.scalar_one_or_none()
+        user_id = result.scalar_one_or_none()
+        await session.commit()
 
-        if existing_user:
+        if user_id is None:
             print(f"User with email {email} already exists.")
             return
 
-        print(f"Creating superadmin: {email}")
-        hashed_password = get_password_hash(password)
-        
-        superadmin = User(
-            email=email,
-            hashed_password=hashed_password,
-            full_name=full_name,
-            role=UserRole.SUPERADMIN,
-            is_active=True
-        )
-        
-        session.add(superadmin)
-        await session.commit()
         print("Superadmin created successfully!")
 
 if __name__ == "__main__":
     try:
-        asyncio.run(create_superadmin())
+        # Prompt before starting the event loop so the coroutine never blocks on stdin
+        email = input("Enter Superadmin Email (default: superadmin@example.com): ").strip() or "superadmin@example.com"
+        full_name = input("Enter Full Name (default: Super Admin): ").strip() or "Super Admin"
+        password = input("Enter Password (default: secret123): ").strip() or "secret123"
+        asyncio.run(create_superadmin(email, full_name, password))
     except KeyboardInterrupt:
         print("\nAborted.")
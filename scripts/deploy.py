@@ -1,5 +1,6 @@
 """Deployment script with environment checks."""
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -31,32 +32,41 @@ def check_environment():
     print("✓ All required environment variables are set")
 
 
-def check_database_connection():
+async def check_database_connection() -> tuple[bool, str]:
     """Check database connection."""
-    try:
-        import asyncio
-        from src.config.database import engine
-
-        async def test_connection():
-            async with engine.begin() as conn:
-                await conn.execute("SELECT 1")
+    import asyncpg
 
-        asyncio.run(test_connection())
-        print("✓ Database connection successful")
+    try:
+        # Plain asyncpg ping: no SQLAlchemy engine or pool needed for one query
+        dsn = settings.database_url.replace("+asyncpg", "")
+        conn = await asyncpg.connect(dsn, timeout=2)
+        try:
+            await conn.fetchval("SELECT 1")
+        finally:
+            await conn.close()
+        return True, "✓ Database connection successful"
     except Exception as e:
-        print(f"✗ Database connection failed: {e}")
-        sys.exit(1)
+        return False, f"✗ Database connection failed: {e}"
 
 
-def check_redis_connection():
+async def check_redis_connection() -> tuple[bool, str]:
     """Check Redis connection."""
+    import redis.asyncio as aioredis
+
     try:
-        from src.config.redis import redis_client
-        redis_client.ping()
-        print("✓ Redis connection successful")
+        client = aioredis.from_url(settings.redis_url, socket_connect_timeout=2)
+        try:
+            await client.ping()
+        finally:
+            await client.close()
+        return True, "✓ Redis connection successful"
     except Exception as e:
-        print(f"✗ Redis connection failed: {e}")
-        sys.exit(1)
+        return False, f"✗ Redis connection failed: {e}"
+
+
+async def check_connections() -> list[tuple[bool, str]]:
+    """Run the network checks concurrently so their round-trips overlap."""
+    return await asyncio.gather(check_database_connection(), check_redis_connection())
 
 
 def main():
@@ -65,8 +75,12 @@ def main():
     print("-" * 50)
 
     check_environment()
-    check_database_connection()
-    check_redis_connection()
+
+    results = asyncio.run(check_connections())
+    for _, message in results:
+        print(message)
+    if not all(ok for ok, _ in results):
+        sys.exit(1)
 
     print("-" * 50)
     print("✓ All checks passed! Ready for deployment.")
@@ -74,4 +88,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
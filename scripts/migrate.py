@@ -1,7 +1,6 @@
 """Script to run Alembic migrations."""
 
 import sys
-import subprocess
 from pathlib import Path
 
 # Add src to path
@@ -9,22 +8,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from alembic.config import Config
 from alembic import command
+from sqlalchemy import create_engine
 
+from src.config import settings
 
-def run_migration(message: str = None, autogenerate: bool = True):
+# Sync engine handed to env.py so migrations skip building their own async engine
+engine = create_engine(settings.database_url_sync)
+
+
+def run_migration(message: str = None, autogenerate: bool = True, downgrade: int = None):
     """Run Alembic migration."""
     alembic_cfg = Config("alembic.ini")
 
-    if message:
-        # Create new migration
-        command.revision(
-            alembic_cfg,
-            autogenerate=autogenerate,
-            message=message,
-        )
-    else:
-        # Apply migrations
-        command.upgrade(alembic_cfg, "head")
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+
+        if message:
+            # Create new migration
+            command.revision(
+                alembic_cfg,
+                autogenerate=autogenerate,
+                message=message,
+            )
+        elif downgrade:
+            command.downgrade(alembic_cfg, f"-{downgrade}")
+        else:
+            # Apply migrations
+            command.upgrade(alembic_cfg, "head")
 
 
 if __name__ == "__main__":
@@ -49,12 +59,5 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    alembic_cfg = Config("alembic.ini")
-
-    if args.create:
-        command.revision(alembic_cfg, autogenerate=True, message=args.create)
-    elif args.downgrade:
-        command.downgrade(alembic_cfg, f"-{args.downgrade}")
-    else:
-        command.upgrade(alembic_cfg, "head")
+    run_migration(message=args.create, downgrade=args.downgrade)
 
@@ -0,0 +1,30 @@
+"""Script to rebuild DumaPod usage_bytes counters from their stored files."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from src.config.database import get_script_session
+from src.models.dumapod import DumaPod
+from src.repositories.duma_stored_file_repo import DumaStoredFileRepository
+
+
+async def recompute_pod_usage(pod_ids: list[int]) -> None:
+    """Recompute usage for the given pods, or for every pod when none are given."""
+    async with get_script_session() as session:
+        if not pod_ids:
+            pod_ids = list((await session.execute(select(DumaPod.id).order_by(DumaPod.id))).scalars())
+
+        repo = DumaStoredFileRepository(session)
+        for pod_id in pod_ids:
+            usage_bytes = await repo.recompute_usage(pod_id)
+            print(f"DumaPod {pod_id}: usage_bytes={usage_bytes}")
+
+
+if __name__ == "__main__":
+    asyncio.run(recompute_pod_usage([int(arg) for arg in sys.argv[1:]]))
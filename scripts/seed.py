@@ -7,46 +7,50 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config.database import AsyncSessionLocal
+from src.config.database import get_script_session
 from src.repositories.subscription_repo import SubscriptionRepository
 from src.repositories.user_repo import UserRepository
 from src.models.user import User, UserRole
 from src.core.security import get_password_hash
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
 async def seed_superadmin():
     """Seed default superadmin user if not exists."""
-    async with AsyncSessionLocal() as session:
+    async with get_script_session() as session:
         user_repo = UserRepository(session)
         
         # Default superadmin credentials
         email = "admin@example.com"
         password = "admin123456"  # Min 8 chars for validation
         full_name = "System Administrator"
-        
-        # Check if superadmin exists
-        stmt = select(User).where(User.email == email)
+
+        # Hash on a worker thread while the session checks out its connection
+        hash_task = asyncio.create_task(asyncio.to_thread(get_password_hash, password))
+        await session.connection()
+        hashed_password = await hash_task
+
+        # Existence check and insert in one statement
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+                role=UserRole.SUPERADMIN,
+                is_active=True,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id)
+        )
         result = await session.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-        
-        if existing_user:
+        user_id = result.scalar_one_or_none()
+        await session.commit()
+
+        if user_id is None:
             print(f"  ✓ Superadmin already exists: {email}")
             return
-        
-        print(f"  Creating default superadmin: {email}")
-        hashed_password = get_password_hash(password)
-        
-        superadmin = User(
-            email=email,
-            hashed_password=hashed_password,
-            full_name=full_name,
-            role=UserRole.SUPERADMIN,
-            is_active=True
-        )
-        
-        session.add(superadmin)
-        await session.commit()
+
         print(f"  ✓ Superadmin created successfully!")
         print(f"    Email: {email}")
         print(f"    Password: {password}")
@@ -55,7 +59,7 @@ async def seed_superadmin():
 
 async def seed_plans():
     """Seed subscription plans."""
-    async with AsyncSessionLocal() as session:
+    async with get_script_session() as session:
         subscription_repo = SubscriptionRepository(session)
 
         plans = [
@@ -116,11 +120,9 @@ async def main():
     print("Starting database seeding...")
     print("=" * 50)
     
-    print("\n[1/2] Seeding Superadmin User")
-    await seed_superadmin()
-    
-    print("\n[2/2] Seeding Subscription Plans")
-    await seed_plans()
+    # Independent sessions on disjoint tables, so both seeds can run at once
+    print("\nSeeding Superadmin User and Subscription Plans")
+    await asyncio.gather(seed_superadmin(), seed_plans())
     
     print("\n" + "=" * 50)
     print("Database seeding completed!")
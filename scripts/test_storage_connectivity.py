@@ -7,6 +7,17 @@ sys.path.append(os.getcwd())
 
 from src.repositories.storage_repo import StorageRepository, get_storage_client, get_bucket_name
 
+async def probe(repo: StorageRepository, provider: str):
+    """Initialize the provider client and HEAD its bucket."""
+    try:
+        client = await repo._get_client(provider)
+        bucket = await repo._get_bucket(provider)
+        # boto3 is blocking; run the HEAD in a thread so providers overlap
+        await asyncio.to_thread(client.head_bucket, Bucket=bucket)
+        return provider, None, client.meta.endpoint_url, bucket
+    except Exception as e:
+        return provider, e, None, None
+
 async def test_storage_connectivity():
     repo = StorageRepository()
     
@@ -14,18 +25,16 @@ async def test_storage_connectivity():
     
     print("--- Testing Storage Connectivity ---")
     
-    for provider in providers:
+    results = await asyncio.gather(*(probe(repo, provider) for provider in providers))
+
+    for provider, error, endpoint, bucket in results:
         print(f"\nTesting Provider: {provider.upper()}")
-        try:
-            client = await repo._get_client(provider)
-            bucket = await repo._get_bucket(provider)
-            endpoint = client.meta.endpoint_url
-            print(f"✅ Client initialized successfully")
+        if error is None:
+            print(f"✅ Bucket reachable")
             print(f"   Endpoint: {endpoint}")
             print(f"   Bucket: {bucket}")
-            
-        except Exception as e:
-            print(f"❌ Failed to initialize client: {e}")
+        else:
+            print(f"❌ Connectivity check failed: {error}")
 
 if __name__ == "__main__":
     asyncio.run(test_storage_connectivity())
@@ -6,26 +6,31 @@ sys.path.append(os.getcwd())
 
 from src.models.user import User
 from src.core.security import get_password_hash
-from src.config.database import AsyncSessionLocal
-from sqlalchemy import select
+from src.config.database import get_script_session
+from sqlalchemy import update
 
 async def update_superadmin_password():
     email = "superadmin@example.com"
     new_password = "secret123"
 
-    async with AsyncSessionLocal() as session:
-        stmt = select(User).where(User.email == email)
+    async with get_script_session() as session:
+        print(f"Updating password for: {email}")
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(hashed_password=get_password_hash(new_password))
+            .returning(User.id)
+            # Nothing is loaded in this session, so skip the identity-map sync
+            .execution_options(synchronize_session=False)
+        )
         result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
+        user_id = result.scalar_one_or_none()
+        await session.commit()
 
-        if not user:
+        if user_id is None:
             print(f"User {email} not found.")
             return
 
-        print(f"Updating password for: {email}")
-        user.hashed_password = get_password_hash(new_password)
-        session.add(user)
-        await session.commit()
         print("Password updated successfully!")
 
 if __name__ == "__main__":
@@ -1,22 +1,47 @@
 """Database configuration and session management."""
 
-from typing import AsyncGenerator
+import asyncio
+from contextvars import ContextVar
+from typing import AsyncGenerator, Optional
+
+import asyncpg
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
+    async_scoped_session,
 )
 from sqlalchemy.orm import declarative_base
 from .settings import settings
 
-# Create async engine
+# Disable the Postgres JIT per connection; it only adds planning latency to
+# the short OLTP queries this app and its scripts run. A larger asyncpg
+# statement cache keeps the prepared repository queries from being evicted.
+_connect_args = (
+    {"server_settings": {"jit": "off"}, "statement_cache_size": 1024}
+    if settings.database_url.startswith("postgresql")
+    else {}
+)
+
+# Create async engine. Each worker process owns its own pool, so size it so
+# that (db_pool_size + db_max_overflow) * workers <= PG max_connections minus
+# headroom for migrations, Celery and admin sessions. A short pool_timeout
+# fails fast under burst instead of queueing requests behind a full pool.
+# Pre-ping costs a round trip on every checkout, so it is off by default and
+# pool_recycle retires connections before server/proxy idle timeouts instead.
+# LIFO checkout keeps a small hot set of connections in use under light load.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_use_lifo=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args=_connect_args,
 )
 
 # Create async session factory
@@ -28,6 +53,13 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Request scope marker, set per request by DBSessionScopeMiddleware
+db_session_scope: ContextVar[Optional[object]] = ContextVar("db_session_scope", default=None)
+
+# Session registry keyed by the current request, so every get_db call made while
+# handling one request shares a single session and connection
+AsyncScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=db_session_scope.get)
+
 # Base class for models
 Base = declarative_base()
 
@@ -35,8 +67,20 @@ Base = declarative_base()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting database session.
-    Yields an async database session and ensures it's closed after use.
+    Inside a request, yields the request-scoped session, which
+    DBSessionScopeMiddleware closes when the request finishes.
+    Otherwise yields an async database session and ensures it's closed after use.
     """
+    if db_session_scope.get() is not None:
+        session = AsyncScopedSession()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        return
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -54,7 +98,51 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_db_pool(connections: Optional[int] = None) -> None:
+    """Open pool connections up front so early requests skip the connect cost."""
+
+    async def _touch() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Checked out concurrently so each call opens a distinct connection
+    count = connections or settings.db_pool_size
+    await asyncio.gather(*(_touch() for _ in range(count)))
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
 
+
+# One-off scripts compile each statement once per run, so their sessions skip
+# the compiled-statement cache
+_script_engine = engine.execution_options(compiled_cache=None)
+
+
+def get_script_session() -> AsyncSession:
+    """Create a session for one-off scripts, bound without the compiled-statement cache."""
+    return AsyncSessionLocal(bind=_script_engine)
+
+
+_dsn_pool: Optional[asyncpg.Pool] = None
+
+
+async def get_dsn_pool() -> asyncpg.Pool:
+    """Get or create a raw asyncpg pool for scripts that only run plain SQL/DDL."""
+    global _dsn_pool
+    if _dsn_pool is None:
+        dsn = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+        _dsn_pool = await asyncpg.create_pool(
+            dsn, min_size=1, max_size=5, server_settings={"jit": "off"}
+        )
+    return _dsn_pool
+
+
+async def close_dsn_pool() -> None:
+    """Close the raw asyncpg pool."""
+    global _dsn_pool
+    if _dsn_pool:
+        await _dsn_pool.close()
+        _dsn_pool = None
+
@@ -1,5 +1,6 @@
 """Redis configuration for Celery and caching."""
 
+import asyncio
 import redis.asyncio as aioredis
 from typing import Optional
 from .settings import settings
@@ -19,6 +20,12 @@ async def get_redis() -> aioredis.Redis:
     return _redis_client
 
 
+async def warm_redis(connections: int = 10) -> None:
+    """Open Redis connections up front with concurrent pings."""
+    client = await get_redis()
+    await asyncio.gather(*(client.ping() for _ in range(connections)))
+
+
 async def close_redis() -> None:
     """Close Redis connection."""
     global _redis_client
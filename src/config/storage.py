@@ -1,68 +1,160 @@
 """Storage configuration for multi-provider support (S3, Oracle, Wasabi)."""
 
+from functools import lru_cache
+
 import boto3
 from botocore.client import BaseClient
 from botocore.config import Config
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from .settings import settings
 
+# Shared by every client. The connection pool is sized above the storage
+# executor's thread count so concurrent calls don't wait for a connection.
+_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=settings.storage_max_pool_connections,
+)
+
+
+def _build_s3() -> BaseClient:
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+        region_name=settings.aws_region,
+        config=_CLIENT_CONFIG,
+    )
+
+
+def _build_oracle() -> BaseClient:
+    # Oracle Cloud Storage uses S3-compatible API
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.oracle_access_key,
+        aws_secret_access_key=settings.oracle_secret_key,
+        endpoint_url=f"https://{settings.oracle_namespace}.compat.objectstorage.{settings.aws_region}.oraclecloud.com",
+        config=_CLIENT_CONFIG,
+    )
+
+
+def _build_wasabi() -> BaseClient:
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.wasabi_access_key,
+        aws_secret_access_key=settings.wasabi_secret_key,
+        endpoint_url=settings.wasabi_endpoint,
+        region_name=settings.aws_region,
+        config=_CLIENT_CONFIG,
+    )
+
+
+# Alternate provider names accepted in settings and stored records
+_ALIASES: Dict[str, str] = {
+    "aws_s3": "s3",
+    "oracle_object_storage": "oracle",
+}
+
+_BUILDERS: Dict[str, Callable[[], BaseClient]] = {
+    "s3": _build_s3,
+    "oracle": _build_oracle,
+    "wasabi": _build_wasabi,
+}
+
+_BUCKETS: Dict[str, str] = {
+    "s3": settings.s3_bucket_name,
+    "oracle": settings.oracle_bucket_name,
+    "wasabi": settings.wasabi_bucket_name,
+}
+
+
+# Canonical keys and aliases in one table. StorageProvider members hash and
+# compare as their string values, so enum and exact-case names resolve with a
+# single lookup and lower() only runs for other spellings.
+_CANONICAL: Dict[str, str] = {**{name: name for name in _BUILDERS}, **_ALIASES}
+
+
+def _normalize_provider(provider: Optional[str]) -> str:
+    """Map a provider name or alias to its canonical lowercase key."""
+    provider = provider or settings.storage_provider
+    canonical = _CANONICAL.get(provider)
+    if canonical is None:
+        provider = provider.lower()
+        canonical = _CANONICAL.get(provider, provider)
+    return canonical
+
 
 def get_storage_client(provider: Optional[str] = None) -> BaseClient:
     """
     Get storage client based on configured provider.
     Returns boto3 client configured for the selected storage provider.
+    Clients are built once per provider and shared for the process lifetime.
     """
-    if not provider:
-        provider = settings.storage_provider
-    
-    provider = provider.lower()
-
-    if provider == "s3" or provider == "aws_s3":
-        return boto3.client(
-            "s3",
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-            region_name=settings.aws_region,
-            config=Config(signature_version="s3v4"),
-        )
-
-    elif provider == "oracle" or provider == "oracle_object_storage":
-        # Oracle Cloud Storage uses S3-compatible API
-        return boto3.client(
-            "s3",
-            aws_access_key_id=settings.oracle_access_key,
-            aws_secret_access_key=settings.oracle_secret_key,
-            endpoint_url=f"https://{settings.oracle_namespace}.compat.objectstorage.{settings.aws_region}.oraclecloud.com",
-            config=Config(signature_version="s3v4"),
-        )
-
-    elif provider == "wasabi":
-        return boto3.client(
-            "s3",
-            aws_access_key_id=settings.wasabi_access_key,
-            aws_secret_access_key=settings.wasabi_secret_key,
-            endpoint_url=settings.wasabi_endpoint,
-            region_name=settings.aws_region,
-            config=Config(signature_version="s3v4"),
-        )
-
-    else:
+    return _build_storage_client(_normalize_provider(provider))
+
+
+@lru_cache(maxsize=None)
+def _build_storage_client(provider: str) -> BaseClient:
+    """Build boto3 client for a normalized provider name."""
+    try:
+        builder = _BUILDERS[provider]
+    except KeyError:
         raise ValueError(f"Unsupported storage provider: {provider}")
+    return builder()
+
+
+def warm_storage_clients() -> None:
+    """
+    Build clients for the default provider and every provider with credentials
+    configured, so botocore's service model load happens at startup rather
+    than on the first storage request.
+    """
+    providers = {_normalize_provider(None)}
+    if settings.aws_access_key_id:
+        providers.add("s3")
+    if settings.oracle_access_key and settings.oracle_namespace:
+        providers.add("oracle")
+    if settings.wasabi_access_key:
+        providers.add("wasabi")
+    for provider in providers:
+        _build_storage_client(provider)
+
+
+@lru_cache(maxsize=256)
+def get_credentials_client(
+    access_key: str,
+    secret_key: str,
+    region: Optional[str],
+    endpoint_url: Optional[str],
+) -> BaseClient:
+    """
+    Get boto3 client for user-supplied storage credentials.
+    Clients are cached per distinct credential set, so repeated requests with
+    the same credentials skip client construction.
+    """
+    return boto3.client(
+        "s3",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region or settings.aws_region,
+        endpoint_url=endpoint_url,
+        config=_CLIENT_CONFIG,
+    )
+
+
+def get_client_and_bucket(provider: Optional[str] = None) -> Tuple[BaseClient, str]:
+    """Get the storage client and bucket name for a provider, normalizing it once."""
+    provider = _normalize_provider(provider)
+    try:
+        bucket = _BUCKETS[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported storage provider: {provider}")
+    return _build_storage_client(provider), bucket
 
 
 def get_bucket_name(provider: Optional[str] = None) -> str:
     """Get bucket name for the configured storage provider."""
-    if not provider:
-        provider = settings.storage_provider
-    
-    provider = provider.lower()
-
-    if provider == "s3" or provider == "aws_s3":
-        return settings.s3_bucket_name
-    elif provider == "oracle" or provider == "oracle_object_storage":
-        return settings.oracle_bucket_name
-    elif provider == "wasabi":
-        return settings.wasabi_bucket_name
-    else:
+    provider = _normalize_provider(provider)
+    try:
+        return _BUCKETS[provider]
+    except KeyError:
         raise ValueError(f"Unsupported storage provider: {provider}")
-
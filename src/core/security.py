@@ -1,23 +1,132 @@
 """Security utilities for password hashing and verification."""
 
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from passlib.context import CryptContext
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. Cost 10 keeps logins well under the default cost-12
+# latency; existing cost-12 hashes fall outside max_rounds and are re-hashed on
+# the next successful login (see verify_and_update_password).
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=10,
+    bcrypt__max_rounds=10,
+)
+
+# Dedicated pool for bcrypt work so CPU-bound hashing from async routes cannot
+# exhaust the event loop's default executor used by other blocking calls.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
+# Successful verifications are remembered briefly so repeated logins skip bcrypt.
+# Entries are keyed by an HMAC under a per-process secret, so the cache never
+# holds plaintext passwords; the stored hash is part of the key, so changing a
+# password invalidates its entry.
+_VERIFY_CACHE_MAXSIZE = 10_000
+_VERIFY_CACHE_TTL_SECONDS = 300
+_verify_cache_secret = secrets.token_bytes(32)
+_verify_cache: "OrderedDict[bytes, float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    message = plain_password.encode() + b"\0" + hashed_password.encode()
+    return hmac.new(_verify_cache_secret, message, hashlib.sha256).digest()
+
+
+def _verify_cache_hit(key: bytes) -> bool:
+    with _verify_cache_lock:
+        expires_at = _verify_cache.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del _verify_cache[key]
+            return False
+        _verify_cache.move_to_end(key)
+        return True
+
+
+def _verify_cache_store(key: bytes) -> None:
+    with _verify_cache_lock:
+        _verify_cache[key] = time.monotonic() + _VERIFY_CACHE_TTL_SECONDS
+        _verify_cache.move_to_end(key)
+        if len(_verify_cache) > _VERIFY_CACHE_MAXSIZE:
+            _verify_cache.popitem(last=False)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
+    cache_key = _verify_cache_key(plain_password, hashed_password)
+    if _verify_cache_hit(cache_key):
+        return True
+
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        verified = pwd_context.verify(plain_password, hashed_password)
     except ValueError as e:
         # passlib < 1.7.5 compatibility with bcrypt 4.0+ / strict 3.x
         if "password cannot be longer than 72 bytes" in str(e):
              return False
         raise e
 
+    # Only successes are cached, so failed guesses always pay the full bcrypt cost
+    if verified:
+        _verify_cache_store(cache_key)
+    return verified
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one is outdated.
+    Returns (verified, new_hash); new_hash is None when no update is needed.
+    """
+    if not pwd_context.needs_update(hashed_password):
+        return verify_password(plain_password, hashed_password), None
+
+    try:
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+    except ValueError as e:
+        if "password cannot be longer than 72 bytes" in str(e):
+            return False, None
+        raise e
+
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Run verify_and_update_password on the password executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_and_update_password, plain_password, hashed_password
+    )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Run verify_password on the password executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Run get_password_hash on the password executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
@@ -3,15 +3,20 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from redis.exceptions import RedisError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from .config import settings
-from .config.database import init_db, close_db
-from .config.redis import close_redis
-from .middleware.rate_limit import limiter
+from .config.database import init_db, close_db, warm_db_pool
+from .config.redis import close_redis, warm_redis
+from .config.storage import warm_storage_clients
+from .middleware.db_session import DBSessionScopeMiddleware
+from .repositories.duma_stored_file_repo import shutdown_progress_flusher
+from .middleware.rate_limit import ClientIPMiddleware, limiter
+from .middleware.request_size import RequestSizeLimitMiddleware
 from .routers import auth, plans, files, webhooks, users, dumapods, credentials, pod_category
 from .utils.logger import configure_logging, get_logger
 
@@ -26,9 +31,24 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application", version=settings.app_version)
     await init_db()
+    await warm_db_pool()
+    try:
+        await warm_redis()
+    except RedisError as e:
+        # Redis only backs caches here, so start without it
+        logger.warning("Redis warm-up failed", error=str(e))
+    try:
+        warm_storage_clients()
+    except ValueError as e:
+        # Misconfigured providers fail again, with context, on first use
+        logger.warning("Storage client warm-up failed", error=str(e))
     yield
     # Shutdown
     logger.info("Shutting down application")
+    try:
+        await shutdown_progress_flusher()
+    except Exception as e:
+        logger.error("Final progress flush failed", error=str(e))
     await close_db()
     await close_redis()
 
@@ -41,12 +61,22 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Resolve the client address once for rate-limit keys
+app.add_middleware(ClientIPMiddleware)
+
+# Request-scoped database sessions
+app.add_middleware(DBSessionScopeMiddleware)
+
+# Reject oversized uploads from Content-Length before the body is read
+app.add_middleware(RequestSizeLimitMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -66,7 +96,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     # In development/debug mode, expose detailed error information
     if settings.debug or settings.environment.lower() in ["development", "dev"]:
         import traceback
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
@@ -78,7 +108,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         )
     
     # In production mode, return generic error message
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
@@ -114,12 +144,21 @@ async def root():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
+    # One worker per core in production; each worker has its own DB pool, so
+    # size DB_POOL_SIZE/DB_MAX_OVERFLOW for the worker count. Debug keeps a
+    # single reloading worker.
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        workers=1 if settings.debug else (os.cpu_count() or 1),
+        loop="uvloop",
+        http="httptools",
+        log_config=None,
+        access_log=False,
     )
 
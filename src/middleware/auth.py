@@ -1,8 +1,11 @@
 """JWT authentication middleware and dependencies."""
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Optional, Tuple
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,10 +17,74 @@ from ..schemas.auth import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
-from ..models.user import User
+from ..models.user import User, UserRole
 
-async def get_current_user(
+# Decoded claims of recently verified tokens, keyed by SHA-256 of the token so
+# raw bearer tokens are never held. Entries never outlive the token's own exp.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+
+
+def _cached_payload(key: bytes) -> Optional[dict]:
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    payload, expires_at = entry
+    if expires_at <= time.time():
+        del _token_cache[key]
+        return None
+    _token_cache.move_to_end(key)
+    return payload
+
+
+def _cache_payload(key: bytes, payload: dict) -> None:
+    expires_at = time.time() + settings.jwt_cache_ttl_seconds
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    _token_cache[key] = (payload, expires_at)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+        _token_cache.popitem(last=False)
+
+
+async def get_token_payload(
+    request: Request,
     token: str = Depends(oauth2_scheme),
+) -> dict:
+    """
+    Dependency to decode and validate the JWT bearer token.
+    Raises HTTPException if the token is invalid.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = _cached_payload(cache_key)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+            )
+        except JWTError:
+            raise credentials_exception
+
+        if payload.get("sub") is None:
+            raise credentials_exception
+
+        if settings.jwt_cache_ttl_seconds > 0:
+            _cache_payload(cache_key, payload)
+
+    # Lets the rate limiter key authenticated requests by user
+    request.state.user_id = payload["sub"]
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -30,16 +97,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
-        )
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenData(user_id=user_id)
-    except JWTError:
-        raise credentials_exception
+    token_data = TokenData(user_id=payload["sub"])
 
     user_repo = UserRepository(db)
     user = await user_repo.get_by_id(int(token_data.user_id))
@@ -49,6 +107,20 @@ async def get_current_user(
     return user
 
 
+async def get_current_admin(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Dependency for admin-only routes.
+    The role is read from the loaded user, not the token's role claim, so
+    promotions and demotions apply before the token expires.
+    """
+    user = await get_current_user(payload, db)
+    check_admin_privileges(user)
+    return user
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create JWT access token.
@@ -74,7 +146,6 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def check_admin_privileges(user: User):
     """Check if user has admin privileges."""
-    from ..models.user import UserRole  # specific import to avoid circular dependency
     if user.role not in [UserRole.SUPERADMIN, UserRole.ADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -84,7 +155,6 @@ def check_admin_privileges(user: User):
 
 def check_superadmin_privileges(user: User):
     """Check if user has superadmin privileges."""
-    from ..models.user import UserRole
     if user.role != UserRole.SUPERADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
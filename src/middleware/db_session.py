@@ -0,0 +1,27 @@
+"""Request-scoped database session middleware."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+from ..config.database import AsyncScopedSession, db_session_scope
+
+
+class DBSessionScopeMiddleware:
+    """
+    Scope database sessions to the current HTTP request.
+    Marks the request in a ContextVar so get_db hands out one shared session,
+    then closes that session once the response (and background tasks) finish.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = db_session_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await AsyncScopedSession.remove()
+            db_session_scope.reset(token)
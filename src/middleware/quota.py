@@ -1,52 +1,110 @@
 """Quota checking middleware for subscription limits."""
 
-from typing import Callable
+import json
+from dataclasses import asdict
+from typing import Optional
 from fastapi import Depends, HTTPException, status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..config.database import get_db
-from ..middleware.auth import get_current_user
-from ..repositories.subscription_repo import SubscriptionRepository
+from ..config.redis import get_redis
+from ..middleware.auth import get_token_payload
+from ..repositories.subscription_repo import SubscriptionRepository, SubscriptionRow
 from ..utils.constants import PlanTier
 
+# Subscription metadata changes rarely; a short TTL bounds staleness while
+# sparing a database lookup on every quota-checked request.
+SUBSCRIPTION_CACHE_TTL_SECONDS = 30
+
+
+def _subscription_cache_key(user_id: int) -> str:
+    return f"sub:{user_id}"
+
+
+async def get_subscription_cached(user_id: int, db: AsyncSession) -> Optional[SubscriptionRow]:
+    """
+    Get a user's active subscription, served from Redis when possible.
+    Falls back to the database if Redis is unavailable.
+    """
+    key = _subscription_cache_key(user_id)
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+        if cached:
+            return SubscriptionRow(**json.loads(cached))
+    except RedisError:
+        redis = None
+
+    subscription_repo = SubscriptionRepository(db)
+    subscription = await subscription_repo.get_by_user_id(user_id)
+
+    if subscription and redis is not None:
+        try:
+            await redis.set(key, json.dumps(asdict(subscription)), ex=SUBSCRIPTION_CACHE_TTL_SECONDS)
+        except RedisError:
+            pass
+    return subscription
+
+
+async def invalidate_subscription_cache(user_id: int) -> None:
+    """Drop a user's cached subscription after it changes."""
+    try:
+        redis = await get_redis()
+        await redis.delete(_subscription_cache_key(user_id))
+    except RedisError:
+        pass
+
+
+async def _require_subscription(user_id: int, db: AsyncSession) -> SubscriptionRow:
+    subscription = await get_subscription_cached(user_id, db)
+
+    if not subscription:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No active subscription found",
+        )
+
+    return subscription
+
+
+async def get_subscription(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db),
+) -> SubscriptionRow:
+    """
+    Dependency to load the current user's active subscription.
+    Shared by the quota and tier checks so FastAPI resolves it once per request.
+    """
+    return await _require_subscription(int(payload["sub"]), db)
+
 
 async def check_quota(
     required_storage_gb: float = 0.0,
     required_files: int = 0,
-    user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> dict:
+    subscription: SubscriptionRow = Depends(get_subscription),
+) -> SubscriptionRow:
     """
     Dependency to check if user has sufficient quota.
     Raises HTTPException if quota exceeded.
     Args:
         required_storage_gb: Required storage in GB
         required_files: Required number of files
-        user: Current authenticated user
-        db: Database session
+        subscription: Current user's active subscription
     Returns:
         User subscription data
     """
-    subscription_repo = SubscriptionRepository(db)
-    subscription = await subscription_repo.get_by_user_id(user["id"])
-
-    if not subscription:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No active subscription found",
-        )
-
     # Check storage quota
-    if subscription["used_storage_gb"] + required_storage_gb > subscription["storage_limit_gb"]:
+    if subscription.used_storage_gb + required_storage_gb > subscription.storage_limit_gb:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Storage quota exceeded. Available: {subscription['storage_limit_gb'] - subscription['used_storage_gb']:.2f} GB",
+            detail=f"Storage quota exceeded. Available: {subscription.storage_limit_gb - subscription.used_storage_gb:.2f} GB",
         )
 
     # Check file count quota
-    if subscription["used_file_count"] + required_files > subscription["file_limit"]:
+    if subscription.used_file_count + required_files > subscription.file_limit:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"File count quota exceeded. Available: {subscription['file_limit'] - subscription['used_file_count']} files",
+            detail=f"File count quota exceeded. Available: {subscription.file_limit - subscription.used_file_count} files",
         )
 
     return subscription
@@ -54,23 +112,13 @@ async def check_quota(
 
 async def check_plan_tier(
     required_tier: PlanTier,
-    user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> dict:
+    subscription: SubscriptionRow = Depends(get_subscription),
+) -> SubscriptionRow:
     """
     Dependency to check if user's plan tier meets requirements.
     Raises HTTPException if tier is insufficient.
     """
-    subscription_repo = SubscriptionRepository(db)
-    subscription = await subscription_repo.get_by_user_id(user["id"])
-
-    if not subscription:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No active subscription found",
-        )
-
-    user_tier = PlanTier(subscription["plan_tier"])
+    user_tier = PlanTier(subscription.plan_tier)
     if user_tier.value < required_tier.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -78,4 +126,3 @@ async def check_plan_tier(
         )
 
     return subscription
-
@@ -4,14 +4,64 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from ..config import settings
 
-# Initialize rate limiter
+
+class ClientIPMiddleware:
+    """
+    Resolve the client address once per request into request.state.client_ip.
+    X-Forwarded-For is only honoured when the socket peer is a configured
+    trusted proxy (TRUSTED_PROXIES); then the last hop, the one appended by that
+    proxy (nginx $proxy_add_x_forwarded_for), is used. Otherwise any caller
+    could pick a fresh rate-limit key per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.trusted_proxies = settings.trusted_proxies
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            client = scope.get("client")
+            client_ip = client[0] if client else "127.0.0.1"
+            if client_ip in self.trusted_proxies:
+                for name, value in scope["headers"]:
+                    if name == b"x-forwarded-for":
+                        client_ip = value.decode("latin-1").rsplit(",", 1)[-1].strip() or client_ip
+                        break
+            scope.setdefault("state", {})["client_ip"] = client_ip
+
+        await self.app(scope, receive, send)
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Rate-limit authenticated requests per user and anonymous ones per client IP.
+    The user id is set on request.state by get_token_payload.
+    """
+    user_id = getattr(request.state, "user_id", None)
+    if user_id:
+        return f"u:{user_id}"
+    return getattr(request.state, "client_ip", None) or get_remote_address(request)
+
+# Initialize rate limiter. Counters live in Redis so every worker and replica
+# enforces the same sliding window; the moving-window strategy runs as a Lua
+# script server-side. Falls back to in-memory counting if Redis is unreachable.
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=[f"{settings.rate_limit_per_minute}/minute"],
+    storage_uri=settings.redis_url,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
 )
 
+# Per-route limits. slowapi parses each string once, when the route is decorated.
+REGISTER_RATE_LIMIT = "5/minute"
+LOGIN_RATE_LIMIT = "10/minute"
+UPLOAD_RATE_LIMIT = "20/minute"
+SUBSCRIBE_RATE_LIMIT = "5/minute"
+
 # Rate limit exceeded handler
 rate_limit_exceeded_handler = _rate_limit_exceeded_handler
 
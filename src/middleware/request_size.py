@@ -0,0 +1,47 @@
+"""Request body size limit middleware."""
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from ..config import settings
+
+# Allowance for multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject requests whose Content-Length exceeds the upload limit.
+    Runs before routing, so oversized bodies are never read or spooled to disk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or settings.max_file_size_mb <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                break
+
+        if content_length is not None:
+            try:
+                size = int(content_length)
+            except ValueError:
+                size = 0
+            if size > settings.max_file_size_bytes + MULTIPART_OVERHEAD_BYTES:
+                response = ORJSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={
+                        "detail": f"Request exceeds maximum allowed size of {settings.max_file_size_mb} MB"
+                    },
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
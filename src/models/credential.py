@@ -13,7 +13,7 @@ class StorageCredential(Base):
     __tablename__ = "storage_credentials"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    dumapod_id: Mapped[int] = mapped_column(Integer, ForeignKey("dumapods.id"), nullable=False)
+    dumapod_id: Mapped[int] = mapped_column(Integer, ForeignKey("dumapods.id"), nullable=False, index=True)
     provider: Mapped[StorageProvider] = mapped_column(Enum(StorageProvider), nullable=False)
     
     # Common fields
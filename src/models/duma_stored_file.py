@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, String, Integer, ForeignKey, Text
+from sqlalchemy import BigInteger, DateTime, String, Integer, ForeignKey, Index, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -14,6 +14,15 @@ class DumaStoredFile(Base):
     """Model for files stored in DumaPods."""
 
     __tablename__ = "duma_stored_files"
+    __table_args__ = (
+        # Covers per-pod usage aggregates over non-failed files
+        Index(
+            "ix_duma_stored_files_active_usage",
+            "dumapod_id",
+            postgresql_where=text("upload_status <> 'failed'"),
+            postgresql_include=["file_size"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     dumapod_id: Mapped[int] = mapped_column(Integer, ForeignKey("dumapods.id"), nullable=False, index=True)
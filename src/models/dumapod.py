@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Integer, ForeignKey, Numeric, JSON
+from sqlalchemy import BigInteger, Boolean, DateTime, Enum, Index, String, Integer, ForeignKey, Numeric, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -24,6 +24,10 @@ class DumaPod(Base):
     """DumaPod (Storage Plan) database model."""
 
     __tablename__ = "dumapods"
+    __table_args__ = (
+        # Matches the newest-first listing order so pages are index range scans
+        Index("ix_dumapods_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
@@ -61,5 +65,8 @@ class DumaPod(Base):
     
     connection_status: Mapped[dict] = mapped_column(JSON, default={}, nullable=False)
 
+    # Bytes of non-failed stored files, kept current by DumaStoredFileRepository
+    usage_bytes: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+
     creator = relationship("User", backref="created_dumapods")
     credentials = relationship("StorageCredential", back_populates="dumapod", cascade="all, delete-orphan")
@@ -23,6 +23,9 @@ class User(Base):
     """User database model."""
 
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING on INSERT and UPDATE, so
+    # callers never need a refresh SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
@@ -1,8 +1,9 @@
 """Base repository with common database operations."""
 
-from typing import Generic, TypeVar, Optional, List, Dict, Any
+from operator import attrgetter
+from typing import Callable, Generic, TypeVar, Optional, List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.orm import DeclarativeBase
 
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
@@ -11,6 +12,9 @@ ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
 
+    # Per-model column names and a matching attrgetter, built on first use
+    _column_getters: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]] = {}
+
     def __init__(self, session: AsyncSession, model: type[ModelType]):
         """
         Initialize repository.
@@ -39,19 +43,23 @@ class BaseRepository(Generic[ModelType]):
 
     async def create(self, **kwargs) -> Dict[str, Any]:
         """Create new entity."""
-        entity = self.model(**kwargs)
-        self.session.add(entity)
-        await self.session.flush()
-        await self.session.refresh(entity)
-        return self._to_dict(entity)
+        # INSERT ... RETURNING yields server defaults without a follow-up SELECT
+        result = await self.session.execute(
+            insert(self.model).values(**kwargs).returning(*self.model.__table__.columns)
+        )
+        return dict(result.mappings().one())
 
     async def update(self, id: int, **kwargs) -> Optional[Dict[str, Any]]:
         """Update entity by ID."""
-        await self.session.execute(
-            update(self.model).where(self.model.id == id).values(**kwargs)
+        # UPDATE ... RETURNING replaces the flush + get_by_id round-trip
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**kwargs)
+            .returning(*self.model.__table__.columns)
         )
-        await self.session.flush()
-        return await self.get_by_id(id)
+        row = result.mappings().one_or_none()
+        return dict(row) if row else None
 
     async def delete(self, id: int) -> bool:
         """Delete entity by ID."""
@@ -65,8 +73,24 @@ class BaseRepository(Generic[ModelType]):
         """Convert SQLAlchemy model to dictionary."""
         if entity is None:
             return None
-        return {
-            column.name: getattr(entity, column.name)
-            for column in entity.__table__.columns
-        }
+        names, getter = self._get_column_getter(type(entity))
+        return dict(zip(names, getter(entity)))
+
+    @classmethod
+    def _get_column_getter(
+        cls, model: type
+    ) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+        """Get cached column names and a getter returning their values as a tuple."""
+        cached = cls._column_getters.get(model)
+        if cached is None:
+            names = tuple(column.name for column in model.__table__.columns)
+            getter = attrgetter(*names)
+            if len(names) == 1:
+                # attrgetter with a single name returns the bare value
+                single = getter
+
+                def getter(entity: Any) -> Tuple[Any, ...]:
+                    return (single(entity),)
+            cached = BaseRepository._column_getters[model] = (names, getter)
+        return cached
 
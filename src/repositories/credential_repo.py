@@ -16,7 +16,6 @@ class CredentialRepository:
         """Create a new credential."""
         self.db.add(credential)
         await self.db.commit()
-        await self.db.refresh(credential)
         return credential
 
     async def get_by_id(self, credential_id: int) -> Optional[StorageCredential]:
@@ -45,7 +44,6 @@ class CredentialRepository:
         for key, value in update_data.model_dump(exclude_unset=True).items():
             setattr(credential, key, value)
         await self.db.commit()
-        await self.db.refresh(credential)
         return credential
 
     async def delete(self, credential: StorageCredential) -> None:
@@ -1,10 +1,84 @@
 """DumaStoredFile repository."""
 
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import Row, insert, select, func, text, update
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from .base import BaseRepository
+from ..config.database import AsyncSessionLocal
 from ..models.duma_stored_file import DumaStoredFile
+from ..models.dumapod import DumaPod
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Progress ticks are coalesced in memory and written in one batched UPDATE per
+# interval, instead of one UPDATE and commit per tick.
+PROGRESS_FLUSH_INTERVAL_SECONDS = 0.25
+
+_UPDATE_PROGRESS_STMT = text(
+    "UPDATE duma_stored_files SET upload_progress = :progress WHERE id = :id"
+)
+
+# Columns needed by file listings; selecting them directly skips ORM entity
+# hydration and leaves multipart bookkeeping columns off the wire.
+_LIST_COLUMNS = (
+    DumaStoredFile.id,
+    DumaStoredFile.user_id,
+    DumaStoredFile.file_name,
+    DumaStoredFile.file_type,
+    DumaStoredFile.file_size,
+    DumaStoredFile.upload_status,
+    DumaStoredFile.upload_progress,
+    DumaStoredFile.failed_reason,
+    DumaStoredFile.s3_url,
+    DumaStoredFile.wasabi_url,
+    DumaStoredFile.oracle_url,
+    DumaStoredFile.created_at,
+)
+
+_progress_buffer: Dict[int, int] = {}
+_progress_event: Optional[asyncio.Event] = None
+_flush_task: Optional[asyncio.Task] = None
+# Serializes flushes, so an older snapshot can never commit after a newer one
+_flush_lock = asyncio.Lock()
+
+
+def _ensure_progress_flusher() -> None:
+    """Start the flush task on the running loop if it is not already running there."""
+    global _progress_event, _flush_task
+    loop = asyncio.get_running_loop()
+    if _flush_task is None or _flush_task.done() or _flush_task.get_loop() is not loop:
+        _progress_event = asyncio.Event()
+        _flush_task = loop.create_task(_progress_flush_loop(_progress_event))
+
+
+async def _progress_flush_loop(event: asyncio.Event) -> None:
+    while True:
+        await event.wait()
+        # Let further ticks accumulate before writing
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL_SECONDS)
+        event.clear()
+        try:
+            await DumaStoredFileRepository.flush_progress()
+        except Exception as e:
+            logger.error("Progress flush failed", error=str(e))
+
+
+async def shutdown_progress_flusher() -> None:
+    """Stop the background flusher and write any progress still buffered."""
+    global _flush_task
+    if _flush_task is not None and not _flush_task.done():
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+    _flush_task = None
+    await DumaStoredFileRepository.flush_progress()
+
 
 class DumaStoredFileRepository(BaseRepository):
     """Repository for DumaStoredFile operations."""
@@ -26,32 +100,63 @@ class DumaStoredFileRepository(BaseRepository):
         upload_status: str = "pending",
     ) -> DumaStoredFile:
         """Create a new file record."""
-        file_record = DumaStoredFile(
-            dumapod_id=dumapod_id,
-            user_id=user_id,
-            file_name=file_name,
-            file_type=file_type,
-            file_size=file_size,
-            storage_key=storage_key,
-            s3_url=s3_url,
-            wasabi_url=wasabi_url,
-            oracle_url=oracle_url,
-            upload_status=upload_status,
+        # INSERT ... RETURNING loads the new row in the same round-trip, so no
+        # refresh SELECT is needed after commit
+        stmt = (
+            insert(DumaStoredFile)
+            .values(
+                dumapod_id=dumapod_id,
+                user_id=user_id,
+                file_name=file_name,
+                file_type=file_type,
+                file_size=file_size,
+                storage_key=storage_key,
+                s3_url=s3_url,
+                wasabi_url=wasabi_url,
+                oracle_url=oracle_url,
+                upload_status=upload_status,
+            )
+            .returning(DumaStoredFile)
+            .execution_options(populate_existing=True)
         )
-        self.session.add(file_record)
+        file_record = (await self.session.execute(stmt)).scalar_one()
+        if upload_status != "failed":
+            await self.session.execute(
+                update(DumaPod)
+                .where(DumaPod.id == dumapod_id)
+                .values(usage_bytes=DumaPod.usage_bytes + file_size)
+                .execution_options(synchronize_session=False)
+            )
         await self.session.commit()
-        await self.session.refresh(file_record)
         return file_record
 
     async def get_total_usage(self, dumapod_id: int) -> int:
         """Get total storage usage for a DumaPod in bytes (excluding failed uploads)."""
-        stmt = select(func.sum(DumaStoredFile.file_size)).where(
-            DumaStoredFile.dumapod_id == dumapod_id,
-            DumaStoredFile.upload_status != "failed"
-        )
+        # Maintained counter instead of summing every file of the pod
+        stmt = select(DumaPod.usage_bytes).where(DumaPod.id == dumapod_id)
         result = await self.session.execute(stmt)
-        total_size = result.scalar()
-        return total_size or 0
+        return result.scalar() or 0
+
+    async def recompute_usage(self, dumapod_id: int) -> int:
+        """Recalculate a DumaPod's usage_bytes counter from its files."""
+        total_size = (
+            select(func.coalesce(func.sum(DumaStoredFile.file_size), 0))
+            .where(
+                DumaStoredFile.dumapod_id == dumapod_id,
+                DumaStoredFile.upload_status != "failed"
+            )
+            .scalar_subquery()
+        )
+        stmt = (
+            update(DumaPod)
+            .where(DumaPod.id == dumapod_id)
+            .values(usage_bytes=total_size)
+            .returning(DumaPod.usage_bytes)
+            .execution_options(synchronize_session=False)
+        )
+        usage_bytes = (await self.session.execute(stmt)).scalar_one_or_none()
+        await self.session.commit()
+        return usage_bytes or 0
 
     async def get_file_count(self, dumapod_id: int) -> int:
         """Get total file count for a DumaPod (excluding failed uploads)."""
@@ -60,13 +165,27 @@ class DumaStoredFileRepository(BaseRepository):
             DumaStoredFile.upload_status != "failed"
         )
         result = await self.session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one()
 
-    async def get_file(self, file_id: int) -> Optional[DumaStoredFile]:
-        """Get file by ID."""
-        stmt = select(DumaStoredFile).where(DumaStoredFile.id == file_id)
+    async def get_usage_summary(self, dumapod_id: int) -> Tuple[int, int]:
+        """Get (total bytes, file count) for a DumaPod in one query (excluding failed uploads)."""
+        stmt = select(
+            func.coalesce(func.sum(DumaStoredFile.file_size), 0),
+            func.count(),
+        ).where(
+            DumaStoredFile.dumapod_id == dumapod_id,
+            DumaStoredFile.upload_status != "failed"
+        )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        total_size, file_count = result.one()
+        return int(total_size), file_count
+
+    async def get_file(self, file_id: int) -> Optional[DumaStoredFile]:
+        """
+        Get file by ID.
+        Served from the session's identity map when already loaded in this request.
+        """
+        return await self.session.get(DumaStoredFile, file_id)
 
     async def update_file_status_and_urls(
         self,
@@ -78,77 +197,110 @@ class DumaStoredFileRepository(BaseRepository):
         failed_reason: Optional[str] = None,
     ) -> Optional[DumaStoredFile]:
         """Update file status and URLs."""
-        # Use direct update to avoid ORM session conflicts with progress tracking
-        stmt = (
-            text("UPDATE duma_stored_files SET upload_status = :status, s3_url = :s3, wasabi_url = :wasabi, oracle_url = :oracle WHERE id = :id")
-            .bindparams(status=status, s3=s3_url, wasabi=wasabi_url, oracle=oracle_url, id=file_id)
-        )
-        # However, we only want to update URLs if provided?
-        # The previous logic did: if s3_url: file_record.s3_url = s3_url
-        # If I pas None to bindparams, it sets NULL in DB!
-        # OLD logic: if s3_url is None, it keeps existing value.
-        # SQL logic: COALESCE? Or dynamic query building.
-        
-        # Build dynamic query
-        update_values = {"status": status}
-        set_clauses = ["upload_status = :status"]
-        
+        # Only provided values are set, so None keeps the existing column value.
+        # Each combination of set columns compiles to its own cached statement.
+        values = {"upload_status": status}
         if s3_url is not None:
-            update_values["s3"] = s3_url
-            set_clauses.append("s3_url = :s3")
+            values["s3_url"] = s3_url
         if wasabi_url is not None:
-            update_values["wasabi"] = wasabi_url
-            set_clauses.append("wasabi_url = :wasabi")
+            values["wasabi_url"] = wasabi_url
         if oracle_url is not None:
-            update_values["oracle"] = oracle_url
-            set_clauses.append("oracle_url = :oracle")
+            values["oracle_url"] = oracle_url
         if failed_reason is not None:
-            update_values["failed_reason"] = failed_reason
-            set_clauses.append("failed_reason = :failed_reason")
-            
-        final_stmt = text(f"UPDATE duma_stored_files SET {', '.join(set_clauses)} WHERE id = :id")
-        final_stmt = final_stmt.bindparams(id=file_id, **update_values)
-        
-        await self.session.execute(final_stmt)
-        await self.session.commit()
-        
-        # Fetch fresh object to return
-        # First expire identity map to ensure fresh fetch
-        # Since we used direct update, validation of cached object is tricky.
-        # But we can just query.
-        # Wait, if we fetch using get_file, and it's in session, we get stale.
-        # We should expire it first?
-        # But we don't have the object instance here easily unless we fetched it.
-        # We can just rely on the fact that we return what we fetched?
-        # Or fetch using populate_existing()?
-        
-        stmt = select(DumaStoredFile).where(DumaStoredFile.id == file_id).execution_options(populate_existing=True)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+            values["failed_reason"] = failed_reason
 
-    async def update_upload_progress(self, file_id: int, progress: int) -> None:
-        """Update upload progress percentage."""
-        # Use execute for efficiency to avoid loading object if not needed, 
-        # but fetching is fine. Let's fetch to be safe with ORM.
-        # Actually, let's use a direct update statement for speed/concurrency 
-        # although with asyncpg it's fast.
+        await self._adjust_usage_for_status(file_id, status)
+
+        # UPDATE ... RETURNING hands back the fresh row in the same round-trip;
+        # populate_existing refreshes any copy already in the identity map
         stmt = (
-            text("UPDATE duma_stored_files SET upload_progress = :progress WHERE id = :id")
-            .bindparams(progress=progress, id=file_id)
+            update(DumaStoredFile)
+            .where(DumaStoredFile.id == file_id)
+            .values(**values)
+            .returning(DumaStoredFile)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
-        await self.session.execute(stmt)
+        file_record = (await self.session.execute(stmt)).scalar_one_or_none()
         await self.session.commit()
+        return file_record
+
+    async def _adjust_usage_for_status(self, file_id: int, status: str) -> None:
+        """
+        Move a file's bytes out of (or back into) its pod's usage_bytes when it
+        enters (or leaves) the failed status.
+        The file row stays locked until the caller commits the status change, so
+        concurrent updates of one file see each other's status and the delta is
+        applied once.
+        """
+        row = (
+            await self.session.execute(
+                select(
+                    DumaStoredFile.dumapod_id,
+                    DumaStoredFile.file_size,
+                    DumaStoredFile.upload_status,
+                )
+                .where(DumaStoredFile.id == file_id)
+                .with_for_update()
+            )
+        ).one_or_none()
+        if row is None or (row.upload_status == "failed") == (status == "failed"):
+            return
+
+        delta = -row.file_size if status == "failed" else row.file_size
+        await self.session.execute(
+            update(DumaPod)
+            .where(DumaPod.id == row.dumapod_id)
+            .values(usage_bytes=DumaPod.usage_bytes + delta)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def update_upload_progress(self, file_id: int, progress: int) -> None:
+        """
+        Record upload progress percentage.
+        Buffered and written in batches; call flush_progress() when it must be persisted now.
+        """
+        _progress_buffer[file_id] = progress
+        _ensure_progress_flusher()
+        _progress_event.set()
+
+        # Keep a copy already loaded in this session in step without a reload
+        file_record = self.session.identity_map.get(identity_key(DumaStoredFile, file_id))
+        if file_record is not None:
+            set_committed_value(file_record, "upload_progress", progress)
+
+    @staticmethod
+    async def flush_progress() -> None:
+        """
+        Write all buffered progress values in a single transaction.
+        Waits for any flush already in flight, so values commit in tick order.
+        """
+        async with _flush_lock:
+            if not _progress_buffer:
+                return
+
+            snapshot = dict(_progress_buffer)
+            _progress_buffer.clear()
+            try:
+                # Own session, so flushes never interleave with a caller's transaction
+                async with AsyncSessionLocal() as session, session.begin():
+                    await session.execute(
+                        _UPDATE_PROGRESS_STMT,
+                        [{"progress": progress, "id": file_id} for file_id, progress in snapshot.items()],
+                    )
+            except Exception:
+                # Keep values not superseded by newer ticks for the next flush
+                for file_id, progress in snapshot.items():
+                    _progress_buffer.setdefault(file_id, progress)
+                raise
 
     async def get_by_user_and_id(
         self, user_id: int, file_id: int
     ) -> Optional[DumaStoredFile]:
         """Get file by ID and user ID."""
-        stmt = select(DumaStoredFile).where(
-            DumaStoredFile.id == file_id,
-            DumaStoredFile.user_id == user_id
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        file_record = await self.session.get(DumaStoredFile, file_id)
+        if file_record is None or file_record.user_id != user_id:
+            return None
+        return file_record
 
     async def get_by_user_id(
         self, user_id: int, skip: int = 0, limit: int = 20
@@ -164,10 +316,31 @@ class DumaStoredFileRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_page_by_user_id(
+        self, user_id: int, skip: int = 0, limit: int = 20
+    ) -> Tuple[list[Row], int]:
+        """
+        Get one page of a user's files as rows of the listing columns, plus the
+        user's total file count. The total comes from a window count in the same
+        query; only a page past the end needs a separate COUNT.
+        """
+        stmt = (
+            select(*_LIST_COLUMNS, func.count().over().label("total"))
+            .where(DumaStoredFile.user_id == user_id)
+            .order_by(DumaStoredFile.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = list((await self.session.execute(stmt)).all())
+        if rows:
+            return rows, rows[0].total
+        total = await self.get_file_count_by_user(user_id) if skip else 0
+        return rows, total
+
     async def get_file_count_by_user(self, user_id: int) -> int:
         """Get total file count for a user."""
         stmt = select(func.count()).select_from(DumaStoredFile).where(
             DumaStoredFile.user_id == user_id
         )
         result = await self.session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one()
@@ -1,7 +1,9 @@
 """DumaPod repository."""
 
 from typing import Any
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from .base import BaseRepository
 from ..models.dumapod import DumaPod
 
@@ -14,20 +16,17 @@ class DumaPodRepository(BaseRepository[DumaPod]):
 
     async def get_by_name(self, name: str) -> DumaPod | None:
         """Get DumaPod by name."""
-        from sqlalchemy import select
         stmt = select(DumaPod).where(DumaPod.name == name)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
         """Get all DumaPods sorted by creation date (newest first)."""
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-        
         stmt = (
             select(DumaPod)
             .options(selectinload(DumaPod.credentials))
-            .order_by(DumaPod.created_at.desc())
+            # id breaks created_at ties so pagination is stable
+            .order_by(DumaPod.created_at.desc(), DumaPod.id.desc())
             .offset(skip).limit(limit)
         )
         result = await self.session.execute(stmt)
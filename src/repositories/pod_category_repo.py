@@ -1,7 +1,6 @@
 """Pod Category repository."""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
 from .base import BaseRepository
 from ..models.pod_category import PodCategory
 
@@ -12,10 +11,3 @@ class PodCategoryRepository(BaseRepository[PodCategory]):
     def __init__(self, session: AsyncSession):
         """Initialize repository."""
         super().__init__(session, PodCategory)
-
-    async def get_by_name(self, name: str) -> PodCategory | None:
-        """Get category by name."""
-        result = await self.session.execute(
-            select(PodCategory).where(PodCategory.name == name)
-        )
-        return result.scalar_one_or_none()
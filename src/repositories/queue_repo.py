@@ -37,6 +37,18 @@ class QueueRepository:
             "status": "queued",
         }
 
+    @staticmethod
+    def enqueue_stripe_event(event_id: str) -> Dict[str, Any]:
+        """Enqueue processing of a stored Stripe webhook event."""
+        # Import here to avoid circular imports
+        from ..tasks.webhooks import process_stripe_event
+
+        task = process_stripe_event.delay(event_id)
+        return {
+            "task_id": task.id,
+            "status": "queued",
+        }
+
     @staticmethod
     def get_task_status(task_id: str) -> Dict[str, Any]:
         """Get Celery task status."""
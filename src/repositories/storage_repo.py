@@ -1,78 +1,296 @@
 """Storage repository for multi-provider storage operations."""
 
 import asyncio
-from typing import Optional
-import boto3
+import hashlib
+import io
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from bisect import bisect_right
+import hmac
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlsplit
+from boto3.s3.transfer import TransferConfig
 from botocore.client import BaseClient
 from botocore.exceptions import ClientError
-from botocore.config import Config
-from ..config.storage import get_storage_client, get_bucket_name
+from ..config.storage import get_storage_client, get_bucket_name, get_client_and_bucket, get_credentials_client
 from ..config import settings
 from ..utils.helpers import generate_s3_key
 
 
+_part_number = itemgetter('part_number')
+
+# Dedicated pool for blocking boto3 calls, so S3 round trips neither queue
+# behind nor starve other users of the loop's default executor
+_storage_executor = ThreadPoolExecutor(
+    max_workers=settings.storage_max_workers, thread_name_prefix="storage"
+)
+
+# Multipart part size by file size: < 100MB, < 1GB, < 10GB, larger.
+# All sizes lie within S3's 5MB-5GB part limits.
+_PART_SIZE_THRESHOLDS = (100 * 1024 * 1024, 1024 * 1024 * 1024, 10 * 1024 * 1024 * 1024)
+_PART_SIZES = (10 * 1024 * 1024, 100 * 1024 * 1024, 500 * 1024 * 1024, 1024 * 1024 * 1024)
+
+# Managed uploads: parts of 16MB sent 20 at a time (default is 8MB x 10), read
+# from the source in 1MB blocks. Threads per upload stay below the client's
+# connection pool size.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=20,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+# Presigned download URLs are reused for a tenth of their lifetime, so hot keys
+# skip re-signing while a returned URL keeps at least 90% of the expiry the
+# caller reports. Only get_object URLs are cached; upload URLs are single-use.
+PRESIGNED_GET_REUSE_FRACTION = 0.1
+_PRESIGNED_GET_CACHE_MAXSIZE = 10_000
+_presigned_get_cache: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
+
+# Number of multipart part URLs signed per executor job
+PRESIGN_CHUNK_SIZE = 256
+
+
+@dataclass(slots=True, frozen=True)
+class PresignedUpload:
+    """Presigned single-request upload: URL, HTTP method and the headers it was signed with."""
+
+    upload_url: str
+    content_type: str
+    content_length: Optional[int] = None
+    method: str = "PUT"
+
+    @property
+    def headers(self) -> dict:
+        headers = {"Content-Type": self.content_type}
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+
+async def _run_blocking(func, /, **kwargs):
+    """Run a blocking boto3 call on the storage executor so it doesn't stall the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_storage_executor, partial(func, **kwargs))
+
+
+def _presign_upload_part(client: BaseClient, bucket: str, key: str, upload_id: str, part_number: int, expiration: int) -> str:
+    return client.generate_presigned_url(
+        'upload_part',
+        Params={
+            'Bucket': bucket,
+            'Key': key,
+            'UploadId': upload_id,
+            'PartNumber': part_number
+        },
+        ExpiresIn=expiration
+    )
+
+
+def _client_credentials(client: BaseClient):
+    """
+    Credentials the client signs with, or None if they can't be read.
+    These are private botocore attributes; None makes callers fall back to
+    botocore's own presigning.
+    """
+    signer = getattr(client, "_request_signer", None)
+    return getattr(signer, "_credentials", None)
+
+
+@lru_cache(maxsize=128)
+def _sigv4_signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """
+    Derive the SigV4 signing key for a credential scope.
+    The key only changes with the date, so it is cached across chunks and requests.
+    """
+    k_date = hmac.new(f"AWS4{secret_key}".encode(), date_stamp.encode(), hashlib.sha256).digest()
+    k_region = hmac.new(k_date, region.encode(), hashlib.sha256).digest()
+    k_service = hmac.new(k_region, service.encode(), hashlib.sha256).digest()
+    return hmac.new(k_service, b"aws4_request", hashlib.sha256).digest()
+
+
+def _sign_upload_parts(
+    client: BaseClient,
+    bucket: str,
+    key: str,
+    upload_id: str,
+    start: int,
+    end: int,
+    expiration: int,
+) -> list:
+    """
+    Presign upload_part URLs for part numbers in [start, end).
+    The first part is signed by botocore; its URL supplies the endpoint, timestamp
+    and credential scope, and the remaining parts are signed directly with SigV4,
+    skipping botocore's per-call request machinery. The URLs differ only in
+    partNumber and signature.
+    """
+    template = _presign_upload_part(client, bucket, key, upload_id, start, expiration)
+    parts = [{'part_number': start, 'upload_url': template}]
+    if end - start <= 1:
+        return parts
+
+    url = urlsplit(template)
+    query = dict(parse_qsl(url.query, keep_blank_values=True))
+    credentials = _client_credentials(client)
+    if query.get("X-Amz-Algorithm") != "AWS4-HMAC-SHA256" or credentials is None:
+        # Not a query-string SigV4 URL; sign the rest through botocore
+        parts.extend(
+            {'part_number': n, 'upload_url': _presign_upload_part(client, bucket, key, upload_id, n, expiration)}
+            for n in range(start + 1, end)
+        )
+        return parts
+
+    secret_key = credentials.get_frozen_credentials().secret_key
+    amz_date = query["X-Amz-Date"]
+    scope = query["X-Amz-Credential"].split("/", 1)[1]
+    date_stamp, region, service, _ = scope.split("/")
+    signing_key = _sigv4_signing_key(secret_key, date_stamp, region, service)
+
+    # Everything except partNumber and the signature is shared by all parts.
+    # Parameters are sorted by name, and partNumber sorts between the
+    # upper-case X-Amz-* names and uploadId.
+    del query["X-Amz-Signature"], query["partNumber"]
+    encoded = sorted((quote(k, safe="-_.~"), quote(v, safe="-_.~")) for k, v in query.items())
+    before = "&".join(f"{k}={v}" for k, v in encoded if k < "partNumber")
+    after = "&".join(f"{k}={v}" for k, v in encoded if k > "partNumber")
+    request_prefix = f"PUT\n{url.path}\n"
+    request_suffix = f"\nhost:{url.netloc}\n\nhost\nUNSIGNED-PAYLOAD"
+    sts_prefix = f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+    base_url = f"{url.scheme}://{url.netloc}{url.path}?"
+
+    for part_number in range(start + 1, end):
+        canonical_query = "&".join(filter(None, (before, f"partNumber={part_number}", after)))
+        canonical_request = request_prefix + canonical_query + request_suffix
+        string_to_sign = sts_prefix + hashlib.sha256(canonical_request.encode()).hexdigest()
+        signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+        parts.append({
+            'part_number': part_number,
+            'upload_url': f"{base_url}{canonical_query}&X-Amz-Signature={signature}",
+        })
+    return parts
+
+
+# Placeholder key signed once per client and bucket to learn the URL layout
+_ENDPOINT_PROBE_KEY = "sigv4-endpoint-probe"
+
+
+@lru_cache(maxsize=256)
+def _get_object_endpoint(client: BaseClient, bucket: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Learn how a client addresses objects in a bucket from one botocore-signed URL.
+    Returns (scheme, host, key path prefix, signing region), or None when the
+    client doesn't presign with query-string SigV4.
+    """
+    url = urlsplit(client.generate_presigned_url(
+        'get_object', Params={'Bucket': bucket, 'Key': _ENDPOINT_PROBE_KEY}, ExpiresIn=60
+    ))
+    query = dict(parse_qsl(url.query, keep_blank_values=True))
+    if query.get("X-Amz-Algorithm") != "AWS4-HMAC-SHA256" or not url.path.endswith("/" + _ENDPOINT_PROBE_KEY):
+        return None
+    region = query["X-Amz-Credential"].split("/")[2]
+    return url.scheme, url.netloc, url.path[:-len(_ENDPOINT_PROBE_KEY)], region
+
+
+def _sign_get_object(client: BaseClient, bucket: str, key: str, expiration: int) -> str:
+    """
+    Presign a get_object URL with SigV4 directly.
+    Endpoint resolution is cached per client and bucket, so each call is just the
+    canonical request, one SHA-256 and one HMAC with the cached signing key.
+    Falls back to botocore for clients that don't presign with SigV4.
+    """
+    endpoint = _get_object_endpoint(client, bucket)
+    credentials = _client_credentials(client)
+    if endpoint is None or credentials is None:
+        return client.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expiration
+        )
+
+    scheme, host, path_prefix, region = endpoint
+    frozen = credentials.get_frozen_credentials()
+    amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{region}/s3/aws4_request"
+    params = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{frozen.access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expiration),
+        "X-Amz-SignedHeaders": "host",
+    }
+    if frozen.token:
+        params["X-Amz-Security-Token"] = frozen.token
+    canonical_query = "&".join(
+        f"{k}={v}"
+        for k, v in sorted((quote(k, safe="-_.~"), quote(v, safe="-_.~")) for k, v in params.items())
+    )
+    path = path_prefix + quote(key, safe="/~")
+    canonical_request = f"GET\n{path}\n{canonical_query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+    string_to_sign = (
+        f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+        + hashlib.sha256(canonical_request.encode()).hexdigest()
+    )
+    signing_key = _sigv4_signing_key(frozen.secret_key, amz_date[:8], region, "s3")
+    signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+    return f"{scheme}://{host}{path}?{canonical_query}&X-Amz-Signature={signature}"
+
+
 class StorageRepository:
     """Repository for storage operations across multiple providers."""
 
-    def __init__(self):
-        # Cache clients by provider name
-        self.clients: dict[str, BaseClient] = {}
-        self.buckets: dict[str, str] = {}
-
     async def _get_client(self, provider: Optional[str] = None, credentials: Optional[object] = None) -> BaseClient:
         """
         Get or create storage client.
-        If credentials provided, creates a new client.
+        If credentials provided, returns the cached client for those credentials.
         """
         if credentials:
-            # Create transient client for custom credentials
-            return boto3.client(
-                "s3",
-                aws_access_key_id=credentials.access_key,
-                aws_secret_access_key=credentials.secret_key,
-                region_name=credentials.region or settings.aws_region,
-                endpoint_url=credentials.endpoint_url,
-                config=Config(signature_version="s3v4"),
+            return get_credentials_client(
+                credentials.access_key,
+                credentials.secret_key,
+                credentials.region,
+                credentials.endpoint_url,
             )
 
-        if not provider:
-            provider = settings.storage_provider
-        
-        provider = provider.lower()
+        # Provider clients are cached process-wide by get_storage_client, so
+        # repositories created per request share them
+        return get_storage_client(provider)
 
-        if provider not in self.clients:
-            self.clients[provider] = get_storage_client(provider)
-            self.buckets[provider] = get_bucket_name(provider)
-            
-        return self.clients[provider]
+    async def _resolve(self, provider: Optional[str] = None, credentials: Optional[object] = None) -> Tuple[BaseClient, str]:
+        """Get the client and bucket for a provider or credential set in one step."""
+        if credentials:
+            client = get_credentials_client(
+                credentials.access_key,
+                credentials.secret_key,
+                credentials.region,
+                credentials.endpoint_url,
+            )
+            return client, credentials.bucket_name
+
+        return get_client_and_bucket(provider)
 
     async def _get_bucket(self, provider: Optional[str] = None, credentials: Optional[object] = None) -> str:
         """Get bucket name."""
         if credentials:
             return credentials.bucket_name
 
-        if not provider:
-            provider = settings.storage_provider
-        
-        provider = provider.lower()
-        
-        if provider not in self.buckets:
-            await self._get_client(provider)
-            
-        return self.buckets[provider]
+        return get_bucket_name(provider)
 
     async def check_connectivity(self, provider: str, credentials: Optional[object] = None) -> bool:
         """
         Check connectivity to storage provider.
         """
         try:
-            client = await self._get_client(provider, credentials)
-            bucket = await self._get_bucket(provider, credentials)
+            client, bucket = await self._resolve(provider, credentials)
             # Perform a lightweight operation to verify access, e.g., head_bucket or list_objects(max_keys=1)
             # head_bucket is strict on permissions, list might be better or head.
             # boto3 head_bucket: 
             # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/head_bucket.html
-            client.head_bucket(Bucket=bucket)
+            await _run_blocking(client.head_bucket, Bucket=bucket)
             return True
         except Exception as e:
             # Log error?
@@ -90,27 +308,72 @@ class StorageRepository:
         """
         Upload file to storage.
         """
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
-        loop = asyncio.get_running_loop()
-        
-        # Create a file-like object from bytes
-        import io
         # Create a file-like object from bytes
-        import io
         file_obj = io.BytesIO(file_content)
         
-        def _upload():
-            client.upload_fileobj(
-                Fileobj=file_obj,
-                Bucket=bucket,
-                Key=key,
-                ExtraArgs={'ContentType': content_type},
-                Callback=progress_callback
-            )
-            
-        await loop.run_in_executor(None, _upload)
+        await _run_blocking(
+            client.upload_fileobj,
+            Fileobj=file_obj,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs={'ContentType': content_type},
+            Callback=progress_callback,
+            Config=_TRANSFER_CONFIG
+        )
+        return key
+
+    async def upload_fileobj(
+        self,
+        fileobj,
+        key: str,
+        content_type: str,
+        provider: Optional[str] = None,
+        credentials: Optional[object] = None,
+        progress_callback: Optional[callable] = None
+    ) -> str:
+        """
+        Upload an open binary file object to storage, reading from its current position.
+        boto3 reads and sends it in parts, so memory use doesn't grow with file size.
+        """
+        client, bucket = await self._resolve(provider, credentials)
+
+        await _run_blocking(
+            client.upload_fileobj,
+            Fileobj=fileobj,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs={'ContentType': content_type},
+            Callback=progress_callback,
+            Config=_TRANSFER_CONFIG
+        )
+        return key
+
+    async def upload_file_from_path(
+        self,
+        file_path: str,
+        key: str,
+        content_type: str,
+        provider: Optional[str] = None,
+        credentials: Optional[object] = None,
+        progress_callback: Optional[callable] = None
+    ) -> str:
+        """
+        Upload a file on disk to storage.
+        boto3 reads and sends the file in parts, so memory use doesn't grow with file size.
+        """
+        client, bucket = await self._resolve(provider, credentials)
+        
+        await _run_blocking(
+            client.upload_file,
+            Filename=file_path,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs={'ContentType': content_type},
+            Callback=progress_callback,
+            Config=_TRANSFER_CONFIG
+        )
         return key
 
     async def generate_presigned_url(
@@ -125,15 +388,23 @@ class StorageRepository:
         Returns:
             Presigned URL
         """
-        client = await self._get_client(provider)
-        bucket = await self._get_bucket(provider)
+        client, bucket = await self._resolve(provider)
+        
+        # Provider clients live for the process, so id(client) stands in for the
+        # provider and its credentials, whatever alias the caller used
+        cache_key = (id(client), bucket, key, expiration)
+        cached = _presigned_get_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            _presigned_get_cache.move_to_end(cache_key)
+            return cached[0]
         
         try:
-            url = client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=expiration,
-            )
+            url = _sign_get_object(client, bucket, key, expiration)
+            _presigned_get_cache[cache_key] = (url, now + expiration * PRESIGNED_GET_REUSE_FRACTION)
+            _presigned_get_cache.move_to_end(cache_key)
+            if len(_presigned_get_cache) > _PRESIGNED_GET_CACHE_MAXSIZE:
+                _presigned_get_cache.popitem(last=False)
             return url
         except ClientError as e:
             raise ValueError(f"Failed to generate presigned URL: {e}")
@@ -142,52 +413,42 @@ class StorageRepository:
         self,
         key: str,
         content_type: str,
-        file_size: int,
+        file_size: Optional[int] = None,
         expiration: int = 3600,
         provider: Optional[str] = None,
         credentials: Optional[object] = None
-    ) -> dict:
+    ) -> PresignedUpload:
         """
         Generate presigned URL for direct file upload.
         
         Args:
             key: Storage key (path) for the file
             content_type: MIME type of the file
-            file_size: Size of the file in bytes
+            file_size: Size of the file in bytes. When given, Content-Length is
+                signed and storage rejects a body of any other size; omit it to
+                let the client stream a body of unknown length
             expiration: URL expiration time in seconds (default: 1 hour)
             provider: Storage provider (s3, wasabi, oracle_object_storage)
             credentials: Optional custom credentials
             
         Returns:
-            Dictionary with:
-            - upload_url: Presigned URL for PUT upload
-            - method: HTTP method (always "PUT")
-            - headers: Required headers for the upload
+            PresignedUpload with the URL, HTTP method ("PUT") and the
+            headers the upload request must send
         """
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
         try:
             # Generate presigned URL for PUT upload
+            params = {"Bucket": bucket, "Key": key, "ContentType": content_type}
+            if file_size is not None:
+                params["ContentLength"] = file_size
             url = client.generate_presigned_url(
                 "put_object",
-                Params={
-                    "Bucket": bucket,
-                    "Key": key,
-                    "ContentType": content_type,
-                    "ContentLength": file_size,
-                },
+                Params=params,
                 ExpiresIn=expiration,
             )
             
-            return {
-                "upload_url": url,
-                "method": "PUT",
-                "headers": {
-                    "Content-Type": content_type,
-                    "Content-Length": str(file_size),
-                }
-            }
+            return PresignedUpload(url, content_type, file_size)
         except ClientError as e:
             raise ValueError(f"Failed to generate presigned upload URL: {e}")
 
@@ -200,22 +461,20 @@ class StorageRepository:
         Returns:
             True if successful
         """
-        client = await self._get_client(provider)
-        bucket = await self._get_bucket(provider)
+        client, bucket = await self._resolve(provider)
         
         try:
-            client.delete_object(Bucket=bucket, Key=key)
+            await _run_blocking(client.delete_object, Bucket=bucket, Key=key)
             return True
         except ClientError:
             return False
 
     async def file_exists(self, key: str, provider: Optional[str] = None) -> bool:
         """Check if file exists in storage."""
-        client = await self._get_client(provider)
-        bucket = await self._get_bucket(provider)
+        client, bucket = await self._resolve(provider)
         
         try:
-            client.head_object(Bucket=bucket, Key=key)
+            await _run_blocking(client.head_object, Bucket=bucket, Key=key)
             return True
         except ClientError:
             return False
@@ -235,11 +494,11 @@ class StorageRepository:
         credentials: Optional[object] = None
     ) -> str:
         """Initiate multipart upload and return upload_id."""
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
         try:
-            response = client.create_multipart_upload(
+            response = await _run_blocking(
+                client.create_multipart_upload,
                 Bucket=bucket,
                 Key=key,
                 ContentType=content_type
@@ -258,27 +517,43 @@ class StorageRepository:
         credentials: Optional[object] = None
     ) -> list:
         """Generate presigned URLs for each part."""
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
-        parts = []
-        for part_number in range(1, total_parts + 1):
-            url = client.generate_presigned_url(
-                'upload_part',
-                Params={
-                    'Bucket': bucket,
-                    'Key': key,
-                    'UploadId': upload_id,
-                    'PartNumber': part_number
-                },
-                ExpiresIn=expiration
+        # Signing is CPU work; sign chunks of parts on the storage executor so
+        # large uploads don't block the event loop and chunks run concurrently.
+        # Chunking keeps the number of executor jobs small for 10k-part uploads.
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(
+                _storage_executor,
+                _sign_upload_parts,
+                client,
+                bucket,
+                key,
+                upload_id,
+                start,
+                min(start + PRESIGN_CHUNK_SIZE, total_parts + 1),
+                expiration,
             )
-            parts.append({
-                'part_number': part_number,
-                'upload_url': url
-            })
-        
-        return parts
+            for start in range(1, total_parts + 1, PRESIGN_CHUNK_SIZE)
+        ))
+        return [part for chunk in chunks for part in chunk]
+
+    async def begin_multipart_upload(
+        self,
+        key: str,
+        content_type: str,
+        total_parts: int,
+        expiration: int = 3600,
+        provider: Optional[str] = None,
+        credentials: Optional[object] = None
+    ) -> Tuple[str, list]:
+        """Initiate a multipart upload and presign all of its part URLs."""
+        upload_id = await self.initiate_multipart_upload(key, content_type, provider, credentials)
+        parts = await self.generate_multipart_presigned_urls(
+            key, upload_id, total_parts, expiration, provider, credentials
+        )
+        return upload_id, parts
 
     async def complete_multipart_upload(
         self,
@@ -289,18 +564,18 @@ class StorageRepository:
         credentials: Optional[object] = None
     ) -> None:
         """Complete multipart upload by combining all parts."""
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
-        multipart_upload = {
-            'Parts': [
-                {'PartNumber': part['part_number'], 'ETag': part['etag']}
-                for part in sorted(parts, key=lambda x: x['part_number'])
-            ]
-        }
+        # Part numbers are small bounded ints (1..10000), so place each part in
+        # its slot in one pass instead of sorting; a re-sent part keeps its last ETag
+        slots = [None] * max(map(_part_number, parts), default=0)
+        for part in parts:
+            slots[part['part_number'] - 1] = {'PartNumber': part['part_number'], 'ETag': part['etag']}
+        multipart_upload = {'Parts': [part for part in slots if part is not None]}
         
         try:
-            client.complete_multipart_upload(
+            await _run_blocking(
+                client.complete_multipart_upload,
                 Bucket=bucket,
                 Key=key,
                 UploadId=upload_id,
@@ -317,11 +592,11 @@ class StorageRepository:
         credentials: Optional[object] = None
     ) -> None:
         """Abort multipart upload and clean up parts."""
-        client = await self._get_client(provider, credentials)
-        bucket = await self._get_bucket(provider, credentials)
+        client, bucket = await self._resolve(provider, credentials)
         
         try:
-            client.abort_multipart_upload(
+            await _run_blocking(
+                client.abort_multipart_upload,
                 Bucket=bucket,
                 Key=key,
                 UploadId=upload_id
@@ -331,25 +606,11 @@ class StorageRepository:
 
     def calculate_part_size(self, file_size: int, max_parts: int = 10000) -> tuple:
         """Calculate optimal part size for multipart upload."""
-        import math
-        
-        MIN_PART_SIZE = 5 * 1024 * 1024  # 5MB
-        MAX_PART_SIZE = 5 * 1024 * 1024 * 1024  # 5GB
-        
-        if file_size < 100 * 1024 * 1024:
-            part_size = 10 * 1024 * 1024
-        elif file_size < 1 * 1024 * 1024 * 1024:
-            part_size = 100 * 1024 * 1024
-        elif file_size < 10 * 1024 * 1024 * 1024:
-            part_size = 500 * 1024 * 1024
-        else:
-            part_size = 1 * 1024 * 1024 * 1024
-        
-        part_size = max(MIN_PART_SIZE, min(part_size, MAX_PART_SIZE))
-        total_parts = math.ceil(file_size / part_size)
-        
+        part_size = _PART_SIZES[bisect_right(_PART_SIZE_THRESHOLDS, file_size)]
+        total_parts = -(-file_size // part_size)
+
         if total_parts > max_parts:
-            part_size = math.ceil(file_size / max_parts)
+            part_size = -(-file_size // max_parts)
             total_parts = max_parts
-        
+
         return (part_size, total_parts)
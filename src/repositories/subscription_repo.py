@@ -1,18 +1,47 @@
 """Subscription repository for subscription and quota management."""
 
-from typing import Optional, Dict, Any, List
+import time
+from dataclasses import dataclass, replace
+from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from .base import BaseRepository
 
 
+# Plans are write-rare reference data; cache them per process
+PLANS_CACHE_TTL_SECONDS = 300
+
+_plans_cache: Optional[Tuple[List[Dict[str, Any]], float]] = None
+
+
+def invalidate_plans_cache() -> None:
+    """Drop the cached plan list so the next read reloads it."""
+    global _plans_cache
+    _plans_cache = None
+
+
+@dataclass(slots=True, frozen=True)
+class SubscriptionRow:
+    """Active subscription with its plan limits and current usage."""
+
+    id: int
+    user_id: int
+    plan_id: int
+    plan_tier: str
+    status: str
+    storage_limit_gb: float
+    used_storage_gb: float
+    file_limit: int
+    used_file_count: int
+
+
 class SubscriptionRepository(BaseRepository):
     """Repository for subscription operations."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_user_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+    async def get_by_user_id(self, user_id: int) -> Optional[SubscriptionRow]:
         """Get active subscription for user."""
         # Placeholder implementation
         # In real implementation:
@@ -22,18 +51,18 @@ class SubscriptionRepository(BaseRepository):
         #     .where(Subscription.status == "active")
         # )
         # subscription = result.scalar_one_or_none()
-        # return self._to_dict(subscription) if subscription else None
-        return {
-            "id": 1,
-            "user_id": user_id,
-            "plan_id": 1,
-            "plan_tier": "basic",
-            "status": "active",
-            "storage_limit_gb": 10.0,
-            "used_storage_gb": 2.5,
-            "file_limit": 100,
-            "used_file_count": 15,
-        }
+        # return SubscriptionRow(...) from the row if subscription else None
+        return SubscriptionRow(
+            id=1,
+            user_id=user_id,
+            plan_id=1,
+            plan_tier="basic",
+            status="active",
+            storage_limit_gb=10.0,
+            used_storage_gb=2.5,
+            file_limit=100,
+            used_file_count=15,
+        )
 
     async def create_subscription(
         self, user_id: int, plan_id: int, stripe_subscription_id: Optional[str] = None
@@ -49,18 +78,29 @@ class SubscriptionRepository(BaseRepository):
         }
 
     async def update_quota(
-        self, subscription_id: int, storage_gb: float = 0.0, file_count: int = 0
-    ) -> Optional[Dict[str, Any]]:
-        """Update subscription quota usage."""
+        self, subscription: SubscriptionRow, storage_gb: float = 0.0, file_count: int = 0
+    ) -> SubscriptionRow:
+        """Update subscription quota usage and return the updated subscription."""
         # Placeholder implementation
-        subscription = await self.get_by_id(subscription_id)
-        if subscription:
-            subscription["used_storage_gb"] += storage_gb
-            subscription["used_file_count"] += file_count
-        return subscription
+        return replace(
+            subscription,
+            used_storage_gb=subscription.used_storage_gb + storage_gb,
+            used_file_count=subscription.used_file_count + file_count,
+        )
 
     async def get_all_plans(self) -> List[Dict[str, Any]]:
-        """Get all available subscription plans."""
+        """
+        Get all available subscription plans.
+        Plans rarely change, so they are served from an in-process cache for
+        PLANS_CACHE_TTL_SECONDS; callers must not mutate the returned dicts.
+        """
+        global _plans_cache
+        now = time.monotonic()
+        if _plans_cache is None or _plans_cache[1] <= now:
+            _plans_cache = (await self._load_plans(), now + PLANS_CACHE_TTL_SECONDS)
+        return _plans_cache[0]
+
+    async def _load_plans(self) -> List[Dict[str, Any]]:
         # Placeholder implementation
         return [
             {
@@ -2,7 +2,7 @@
 
 from typing import Optional, Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from .base import BaseRepository
 from ..models.user import User, UserRole
 
@@ -19,6 +19,12 @@ class UserRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def email_exists(self, email: str) -> bool:
+        """Check whether a user with this email exists without loading the row."""
+        stmt = select(exists().where(User.email == email))
+        result = await self.session.execute(stmt)
+        return bool(result.scalar())
+
     async def create_user(
         self,
         email: str,
@@ -49,7 +55,6 @@ class UserRepository(BaseRepository):
         for key, value in data.items():
             setattr(user, key, value)
         await self.session.commit()
-        await self.session.refresh(user)
         return user
 
     async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
@@ -5,14 +5,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..config.database import get_db
 from ..services.auth_service import AuthService
 from ..schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
-from ..middleware.rate_limit import limiter
+from ..middleware.rate_limit import limiter, LOGIN_RATE_LIMIT, REGISTER_RATE_LIMIT
 from fastapi import Request
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
+@limiter.limit(REGISTER_RATE_LIMIT)
 async def register(
     request: Request,
     register_data: RegisterRequest,
@@ -24,7 +24,7 @@ async def register(
 
 
 @router.post("/login", response_model=TokenResponse)
-@limiter.limit("10/minute")
+@limiter.limit(LOGIN_RATE_LIMIT)
 async def login(
     request: Request,
     login_data: LoginRequest,
@@ -6,7 +6,7 @@ from ..config.database import get_db
 from ..models.user import User, UserRole
 from ..schemas.credential import CredentialCreate, CredentialResponse, CredentialUpdate
 from ..services.credential_service import CredentialService
-from ..middleware.auth import get_current_user, check_admin_privileges
+from ..middleware.auth import get_current_admin
 
 router = APIRouter(
     prefix="/dumapods/{dumapod_id}/credentials",
@@ -19,14 +19,13 @@ router = APIRouter(
 async def create_credential(
     dumapod_id: int,
     credential_data: CredentialCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new storage credential for a DumaPod.
     Only Admins and Superadmins can create credentials.
     """
-    check_admin_privileges(current_user)
     service = CredentialService(db)
     return await service.create_credential(dumapod_id, credential_data)
 
@@ -34,13 +33,12 @@ async def create_credential(
 @router.get("", response_model=List[CredentialResponse])
 async def get_credentials(
     dumapod_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List all credentials for a DumaPod.
     """
-    check_admin_privileges(current_user)
     service = CredentialService(db)
     return await service.get_credentials(dumapod_id)
 
@@ -55,13 +53,12 @@ async def update_credential(
     dumapod_id: int,
     credential_id: int,
     credential_data: CredentialUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Update a storage credential.
     """
-    check_admin_privileges(current_user)
     service = CredentialService(db)
     # verify credential belongs to dumapod logic could be added here
     return await service.update_credential(credential_id, credential_data)
@@ -71,12 +68,11 @@ async def update_credential(
 async def delete_credential(
     dumapod_id: int,
     credential_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Delete a storage credential.
     """
-    check_admin_privileges(current_user)
     service = CredentialService(db)
     await service.delete_credential(credential_id)
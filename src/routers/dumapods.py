@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..config.database import get_db
 from ..services.dumapod_service import DumaPodService
 from ..schemas.dumapod import DumaPodCreate, DumaPodUpdate, DumaPodResponse
-from ..middleware.auth import get_current_user, check_admin_privileges
+from ..middleware.auth import get_current_admin
 from ..models.user import User
 from fastapi import Request
 
@@ -17,11 +17,10 @@ router = APIRouter(prefix="/dumapods", tags=["dumapods"])
 async def create_dumapod(
     request: Request,
     pod_data: DumaPodCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new DumaPod (Admin only)."""
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     return await service.create_dumapod(pod_data, user_id=current_user.id)
 
@@ -31,11 +30,10 @@ async def list_dumapods(
     request: Request,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """List all DumaPods (Admin only)."""
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     return await service.get_all_dumapods(skip=skip, limit=limit)
 
@@ -43,11 +41,10 @@ async def list_dumapods(
 @router.get("/{pod_id}", response_model=DumaPodResponse)
 async def get_dumapod(
     pod_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get DumaPod details (Admin only)."""
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     return await service.get_dumapod(pod_id)
 
@@ -56,11 +53,10 @@ async def get_dumapod(
 async def update_dumapod(
     pod_id: int,
     pod_data: DumaPodUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update DumaPod (Admin only)."""
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     return await service.update_dumapod(pod_id, pod_data)
 
@@ -68,11 +64,10 @@ async def update_dumapod(
 @router.delete("/{pod_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_dumapod(
     pod_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete (soft) DumaPod (Admin only)."""
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     await service.delete_dumapod(pod_id)
 
@@ -80,13 +75,12 @@ async def delete_dumapod(
 @router.post("/{pod_id}/check-connection", response_model=dict[str, bool])
 async def check_pod_connection(
     pod_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Manually check and update connectivity status for a DumaPod.
     Returns the updated status map.
     """
-    check_admin_privileges(current_user)
     service = DumaPodService(db)
     return await service.check_and_update_connection_status(pod_id)
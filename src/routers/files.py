@@ -19,7 +19,7 @@ from ..schemas.file import (
 from ..middleware.auth import get_current_user
 from ..models.user import User
 from ..middleware.quota import check_quota
-from ..middleware.rate_limit import limiter
+from ..middleware.rate_limit import limiter, UPLOAD_RATE_LIMIT
 from fastapi import Request
 
 from fastapi import BackgroundTasks
@@ -28,7 +28,7 @@ router = APIRouter(prefix="/files", tags=["files"])
 
 
 @router.post("/upload", response_model=FileResponse, status_code=status.HTTP_202_ACCEPTED)
-@limiter.limit("20/minute")
+@limiter.limit(UPLOAD_RATE_LIMIT)
 async def upload_file(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -102,7 +102,7 @@ async def get_download_url(
 
 
 @router.post("/initiate-upload", response_model=PresignedUploadResponse, status_code=status.HTTP_200_OK)
-@limiter.limit("20/minute")
+@limiter.limit(UPLOAD_RATE_LIMIT)
 async def initiate_direct_upload(
     request: Request,
     upload_request: InitiateUploadRequest,
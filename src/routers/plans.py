@@ -7,7 +7,7 @@ from ..config.database import get_db
 from ..services.subscription_service import SubscriptionService
 from ..schemas.subscription import PlanSchema, SubscriptionCreate, SubscriptionResponse, QuotaStatus
 from ..middleware.auth import get_current_user
-from ..middleware.rate_limit import limiter
+from ..middleware.rate_limit import limiter, SUBSCRIBE_RATE_LIMIT
 from fastapi import Request
 
 router = APIRouter(prefix="/plans", tags=["subscriptions"])
@@ -21,7 +21,7 @@ async def list_plans(db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/subscribe", response_model=SubscriptionResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
+@limiter.limit(SUBSCRIBE_RATE_LIMIT)
 async def subscribe(
     request: Request,
     subscription_data: SubscriptionCreate,
@@ -2,6 +2,7 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..config.database import get_db
 from ..repositories.pod_category_repo import PodCategoryRepository
@@ -10,7 +11,7 @@ from ..schemas.pod_category import (
     PodCategoryUpdate,
     PodCategoryResponse,
 )
-from ..middleware.auth import get_current_user, check_admin_privileges
+from ..middleware.auth import get_current_user, get_current_admin
 from ..models.user import User
 
 
@@ -20,21 +21,20 @@ router = APIRouter(prefix="/pod-categories", tags=["pod-categories"])
 @router.post("", response_model=PodCategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: PodCategoryCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new pod category (Admin only)."""
-    check_admin_privileges(current_user)
     repo = PodCategoryRepository(db)
-    
-    existing = await repo.get_by_name(category_data.name)
-    if existing:
+
+    # The unique index on name rejects duplicates, so no lookup precedes the insert
+    try:
+        return await repo.create(**category_data.model_dump())
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category with this name already exists",
         )
-        
-    return await repo.create(**category_data.model_dump())
 
 
 @router.get("", response_model=List[PodCategoryResponse])
@@ -73,11 +73,10 @@ async def get_category(
 async def update_category(
     category_id: int,
     category_data: PodCategoryUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a pod category (Admin only)."""
-    check_admin_privileges(current_user)
     repo = PodCategoryRepository(db)
     
     current_category = await repo.get_by_id(category_id)
@@ -87,26 +86,22 @@ async def update_category(
             detail="Category not found",
         )
         
-    if category_data.name:
-        existing = await repo.get_by_name(category_data.name)
-        if existing and existing.id != category_id:
-             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Category with this name already exists",
-            )
-            
-    updated = await repo.update(category_id, **category_data.model_dump(exclude_unset=True))
-    return updated
+    try:
+        return await repo.update(category_id, **category_data.model_dump(exclude_unset=True))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category with this name already exists",
+        )
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a pod category (Admin only)."""
-    check_admin_privileges(current_user)
     repo = PodCategoryRepository(db)
     
     current_category = await repo.get_by_id(category_id)
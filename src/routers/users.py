@@ -7,7 +7,7 @@ from ..config.database import get_db
 from ..services.user_service import UserService
 from ..schemas.user import UserCreate, UserUpdate, UserWithUsageResponse
 from ..schemas.auth import UserResponse
-from ..middleware.auth import get_current_user, check_admin_privileges, check_superadmin_privileges
+from ..middleware.auth import get_current_user, get_current_admin, check_admin_privileges, check_superadmin_privileges
 from ..models.user import User, UserRole
 from ..middleware.rate_limit import limiter
 from fastapi import Request
@@ -20,11 +20,10 @@ async def list_users(
     request: Request,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """List all users (Admin only)."""
-    check_admin_privileges(current_user)
     user_service = UserService(db)
     return await user_service.get_users(skip=skip, limit=limit)
 
@@ -35,7 +34,7 @@ async def list_users_usage(
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -43,7 +42,6 @@ async def list_users_usage(
     Includes pod capacity, used storage, balance, and file count.
     Optional: Filter by user_id.
     """
-    check_admin_privileges(current_user)
     user_service = UserService(db)
     return await user_service.get_users_with_usage(skip=skip, limit=limit, user_id=user_id)
 
@@ -52,12 +50,10 @@ async def list_users_usage(
 async def create_user(
     request: Request,
     user_data: UserCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new user (Admin only)."""
-    check_admin_privileges(current_user)
-    
     # Only superadmin can create admins/superadmins
     if user_data.role in [UserRole.ADMIN, UserRole.SUPERADMIN]:
         check_superadmin_privileges(current_user)
@@ -77,11 +73,10 @@ async def read_users_me(
 @router.get("/{user_id}", response_model=UserResponse)
 async def read_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Get specific user."""
-    check_admin_privileges(current_user)
     user_service = UserService(db)
     return await user_service.get_user(user_id)
 
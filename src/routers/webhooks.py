@@ -1,13 +1,18 @@
 """Webhook routes for external services (Stripe, etc.)."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from fastapi import APIRouter, HTTPException, status, Request, Header
 from typing import Optional
-from ..config.database import get_db
 from ..config import settings
-from ..services.subscription_service import SubscriptionService
+from ..config.redis import get_redis
 from ..config.stripe import stripe_client
+from ..repositories.queue_repo import QueueRepository
 from ..schemas.shared import SuccessResponse
+from ..tasks.webhooks import (
+    STRIPE_EVENT_TTL_SECONDS,
+    stripe_event_key,
+    stripe_event_processed_key,
+)
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
@@ -16,11 +21,10 @@ router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 async def stripe_webhook(
     request: Request,
     stripe_signature: Optional[str] = Header(None, alias="stripe-signature"),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Handle Stripe webhook events.
-    Verifies webhook signature and processes events.
+    Verifies webhook signature, then queues the event for a Celery worker.
     """
     payload = await request.body()
 
@@ -46,12 +50,27 @@ async def stripe_webhook(
             detail=f"Invalid signature: {str(e)}",
         )
 
-    # Process webhook event
-    subscription_service = SubscriptionService(db)
-    result = await subscription_service.handle_stripe_webhook(event)
+    # Store the raw event once per event id. A redelivery is queued again unless
+    # the worker has already marked the event processed; the task skips events
+    # that are, so each one is applied once.
+    event_id = event["id"]
+    key = stripe_event_key(event_id)
+    redis = await get_redis()
+    is_new = await redis.set(key, payload.decode(), nx=True, ex=STRIPE_EVENT_TTL_SECONDS)
+    needs_processing = is_new or not await redis.exists(stripe_event_processed_key(event_id))
+
+    if needs_processing:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, QueueRepository.enqueue_stripe_event, event_id)
+        except Exception:
+            # Let Stripe retry the delivery
+            if is_new:
+                await redis.delete(key)
+            raise
 
     return SuccessResponse(
-        message="Webhook processed successfully",
-        data=result,
+        message="Webhook received",
+        data={"received": True, "event_id": event_id},
     )
 
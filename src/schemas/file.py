@@ -2,22 +2,20 @@
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
-from ..middleware.validation import FileValidators
+from pydantic import BaseModel, ConfigDict, Field
+from ..middleware.validation import AllowedContentType, FileSizeBytes
 
 
 class FileUpload(BaseModel):
     """File upload metadata schema."""
 
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     filename: str
-    content_type: str = Field(..., description="MIME type of the file")
-    file_size: int = Field(..., ge=0, description="File size in bytes")
+    content_type: AllowedContentType = Field(..., description="MIME type of the file")
+    file_size: FileSizeBytes = Field(..., description="File size in bytes")
     description: Optional[str] = Field(None, max_length=500)
 
-    # Apply validators
-    _validate_file_size = FileValidators.validate_file_size_bytes
-    _validate_content_type = FileValidators.validate_content_type
-
 
 class FileResponse(BaseModel):
     """File response schema."""
@@ -74,15 +72,14 @@ class FileDownloadResponse(BaseModel):
 class InitiateUploadRequest(BaseModel):
     """Request to initiate direct upload."""
     
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     dumapod_id: int = Field(..., description="ID of the DumaPod to upload to")
     filename: str = Field(..., min_length=1, max_length=255, description="Original filename")
-    content_type: str = Field(..., description="MIME type of the file")
+    content_type: AllowedContentType = Field(..., description="MIME type of the file")
+    # Size limit is enforced by FileService, which answers 413 rather than 422
     file_size: int = Field(..., gt=0, description="File size in bytes")
     description: Optional[str] = Field(None, max_length=500, description="Optional file description")
-    
-    # Apply validators
-    _validate_file_size = FileValidators.validate_file_size_bytes
-    _validate_content_type = FileValidators.validate_content_type
 
 
 class PresignedUploadResponse(BaseModel):
@@ -106,6 +103,9 @@ class ConfirmUploadRequest(BaseModel):
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+# S3 caps a multipart upload at 10,000 parts
+MAX_MULTIPART_PARTS = 10_000
+
 
 class MultipartPartInfo(BaseModel):
     """Information about a single part in multipart upload."""
@@ -138,7 +138,7 @@ class InitiateMultipartUploadResponse(BaseModel):
 
 class MultipartPartComplete(BaseModel):
     """Information about a completed part."""
-    part_number: int = Field(..., description="Part number (1-indexed)")
+    part_number: int = Field(..., ge=1, le=MAX_MULTIPART_PARTS, description="Part number (1-indexed)")
     etag: str = Field(..., description="ETag returned by S3 after uploading the part")
 
 
@@ -4,7 +4,7 @@ from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.user_repo import UserRepository
-from ..core.security import verify_password, get_password_hash
+from ..core.security import verify_and_update_password_async, get_password_hash_async
 from ..middleware.auth import create_access_token
 from ..schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
 from datetime import timedelta
@@ -31,7 +31,10 @@ class AuthService:
                 detail="Incorrect email or password",
             )
 
-        if not verify_password(login_data.password, user.hashed_password):
+        verified, new_hash = await verify_and_update_password_async(
+            login_data.password, user.hashed_password
+        )
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -43,6 +46,10 @@ class AuthService:
                 detail="User account is inactive",
             )
 
+        if new_hash:
+            # Lazily migrate hashes created with older parameters
+            await self.user_repo.update_user(user, {"hashed_password": new_hash})
+
         access_token_expires = timedelta(
             minutes=settings.jwt_access_token_expire_minutes
         )
@@ -63,15 +70,14 @@ class AuthService:
         Raises HTTPException if email already exists.
         """
         # Check if user already exists
-        existing_user = await self.user_repo.get_by_email(register_data.email)
-        if existing_user:
+        if await self.user_repo.email_exists(register_data.email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
         # Hash password and create user
-        hashed_password = get_password_hash(register_data.password)
+        hashed_password = await get_password_hash_async(register_data.password)
         user = await self.user_repo.create_user(
             email=register_data.email,
             hashed_password=hashed_password,
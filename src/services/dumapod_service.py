@@ -1,5 +1,6 @@
 """DumaPod service."""
 
+import asyncio
 from typing import List, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -91,12 +92,18 @@ class DumaPodService:
             else:
                  return await storage_repo.check_connectivity(provider)
 
+        checks = {}
         if enable_s3:
-            status_map[StorageProvider.AWS_S3] = await check(StorageProvider.AWS_S3, use_custom_s3)
+            checks[StorageProvider.AWS_S3] = check(StorageProvider.AWS_S3, use_custom_s3)
         if enable_wasabi:
-            status_map[StorageProvider.WASABI] = await check(StorageProvider.WASABI, use_custom_wasabi)
+            checks[StorageProvider.WASABI] = check(StorageProvider.WASABI, use_custom_wasabi)
         if enable_oracle:
-            status_map[StorageProvider.ORACLE_OS] = await check(StorageProvider.ORACLE_OS, use_custom_oracle)
+            checks[StorageProvider.ORACLE_OS] = check(StorageProvider.ORACLE_OS, use_custom_oracle)
+
+        # Each check is a storage round trip; run them concurrently so the total
+        # is the slowest provider rather than the sum
+        results = await asyncio.gather(*checks.values())
+        status_map.update(zip(checks, results))
             
         return status_map
 
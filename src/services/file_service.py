@@ -2,8 +2,12 @@
 
 import shutil
 import asyncio
+import time
 import aiofiles
-from typing import List, Optional, Tuple
+from calendar import timegm
+from functools import cached_property
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlsplit
 from fastapi import UploadFile, HTTPException, status, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.file_repo import FileRepository
@@ -19,20 +23,51 @@ from .credential_service import CredentialService
 from ..models.dumapod import StorageProvider, DumaPod
 from ..repositories.duma_stored_file_repo import DumaStoredFileRepository
 
+# Stateless repositories, shared by every FileService instance
+_storage_repo = StorageRepository()
+_queue_repo = QueueRepository()
+
+
+def _url_expires_in(url: str, default: int) -> int:
+    """
+    Seconds until a presigned URL expires, from its X-Amz-Date and X-Amz-Expires.
+    Returns default for URLs without SigV4 query parameters.
+    """
+    query = dict(parse_qsl(urlsplit(url).query))
+    try:
+        signed_at = timegm(time.strptime(query["X-Amz-Date"], "%Y%m%dT%H%M%SZ"))
+        lifetime = int(query["X-Amz-Expires"])
+    except (KeyError, ValueError):
+        return default
+    return max(0, int(signed_at + lifetime - time.time()))
+
 
 class FileService:
     """Service for file operations."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.file_repo = FileRepository(db)
-        self.storage_repo = StorageRepository()
-        self.queue_repo = QueueRepository()
-        self.subscription_repo = SubscriptionRepository(db)
-        self.dumapod_service = DumaPodService(db)
-        self.credential_service = CredentialService(db)
+        self.storage_repo = _storage_repo
+        self.queue_repo = _queue_repo
         self.duma_file_repo = DumaStoredFileRepository(db)
 
+    # Collaborators only some endpoints need are built on first use
+    @cached_property
+    def file_repo(self) -> FileRepository:
+        return FileRepository(self.db)
+
+    @cached_property
+    def subscription_repo(self) -> SubscriptionRepository:
+        return SubscriptionRepository(self.db)
+
+    @cached_property
+    def dumapod_service(self) -> DumaPodService:
+        return DumaPodService(self.db)
+
+    @cached_property
+    def credential_service(self) -> CredentialService:
+        return CredentialService(self.db)
+
 
     def _validate_pod_for_upload(self, dumapod: dict | DumaPod):
         """Validate DumaPod for upload capability."""
@@ -92,7 +127,7 @@ class FileService:
         from ..utils.logger import get_logger
         logger = get_logger(__name__)
         
-        logger.info(f"Staging upload for user {user_id}, file: {file.filename}")
+        logger.info("Staging upload", user_id=user_id, filename=file.filename)
         
         # 1. Validate File Type (no full read needed)
         validate_file_upload(file)
@@ -190,8 +225,9 @@ class FileService:
         self, file_id: int, file: UploadFile, dumapod_id: int, user_id: int, description: Optional[str] = None
     ):
         """
-        Background task: Stream file from client, save to temp, upload to providers.
-        Uses chunked streaming to handle large files without memory issues.
+        Background task: upload the client's file to the enabled providers.
+        A single provider reads straight from the request's spooled file; several
+        providers upload in parallel from a temp copy so each gets its own reader.
         """
         import os
         import asyncio
@@ -202,42 +238,10 @@ class FileService:
         temp_path = None
         
         try:
-            logger.info(f"Starting background upload for file {file_id}")
-            
-            # 1. Stream file to temporary storage in chunks
-            fd, temp_path = tempfile.mkstemp(suffix=f"_{file_id}")
-            chunk_size = 8 * 1024 * 1024  # 8MB chunks
-            total_bytes_written = 0
-            
-            logger.info(f"Streaming file to temp: {temp_path}")
-            
-            # Stream file in chunks using aiofiles
-            async with aiofiles.open(temp_path, 'wb') as temp_file:
-                while True:
-                    chunk = await file.read(chunk_size)
-                    if not chunk:
-                        break
-                    await temp_file.write(chunk)
-                    total_bytes_written += len(chunk)
-                    
-                    # Update progress every chunk (optional, can be less frequent)
-                    # For now, we'll update after all chunks are written
-            
-            logger.info(f"File streamed to temp: {total_bytes_written} bytes")
-            
-            # Update status to "pending" - file uploaded from client, now uploading to S3
+            logger.info("Starting background upload", file_id=file_id)
+
+            # Update status to "pending" - file received from client, now uploading to storage
             await self.duma_file_repo.update_file_status_and_urls(file_id, "pending")
-            
-            # 2. Read content from temp file for S3 upload
-            if not os.path.exists(temp_path):
-                error_msg = f"Temp file {temp_path} not found for file {file_id}"
-                logger.error(error_msg)
-                await self.duma_file_repo.update_file_status_and_urls(file_id, "failed", failed_reason=error_msg)
-                return
-            
-            # Read file content from temp path
-            async with aiofiles.open(temp_path, 'rb') as f:
-                file_content = await f.read()
 
             import threading
             
@@ -283,12 +287,9 @@ class FileService:
                                 try:
                                     fut.result()
                                 except Exception as e:
-                                    logger.error(f"Progress callback error: {e}")
+                                    logger.error("Progress callback error", error=str(e))
                             future.add_done_callback(log_error)
 
-            loop = asyncio.get_running_loop()
-            tracker = ProgressTracker(self, file_id, len(file_content), loop)
-
             # Re-fetch dumapod logic for providers
             dumapod = await self.dumapod_service.get_dumapod(dumapod_id)
             # Normalize DumaPod Data
@@ -318,7 +319,7 @@ class FileService:
                     return {"provider": provider_type, "credentials": None}
                 creds = await self.credential_service.repo.get_by_dumapod_and_provider(dumapod_id, provider_type)
                 if not creds:
-                     logger.warning(f"Custom creds missing for {provider_type}")
+                     logger.warning("Custom creds missing", provider=provider_type)
                      return None
                 return {"provider": provider_type, "credentials": creds}
 
@@ -342,12 +343,37 @@ class FileService:
             # Fetch the record to get filename
             stored_file = await self.duma_file_repo.get_file(file_id)
             if not stored_file:
-                logger.error(f"File record {file_id} not found")
+                logger.error("File record not found", file_id=file_id)
                 return 
             
             sanitized_filename = stored_file.file_name
             storage_key = self.storage_repo.generate_key(user_id, sanitized_filename)
 
+            if len(providers_to_upload) == 1:
+                # The request body is already spooled; upload it without a second copy
+                file_size = file.file.seek(0, os.SEEK_END)
+                file.file.seek(0)
+            else:
+                # Parallel uploads need independent readers, so copy once to a temp file
+                fd, temp_path = tempfile.mkstemp(suffix=f"_{file_id}")
+                os.close(fd)  # Written through aiofiles below
+                chunk_size = 8 * 1024 * 1024  # 8MB chunks
+
+                logger.info("Streaming file to temp", temp_path=temp_path)
+                await file.seek(0)
+                async with aiofiles.open(temp_path, 'wb') as temp_file:
+                    while True:
+                        chunk = await file.read(chunk_size)
+                        if not chunk:
+                            break
+                        await temp_file.write(chunk)
+
+                file_size = os.path.getsize(temp_path)
+                logger.info("File streamed to temp", bytes_written=file_size)
+
+            loop = asyncio.get_running_loop()
+            tracker = ProgressTracker(self, file_id, file_size, loop)
+
             upload_urls = {}
             
             async def _upload_and_get_url(p_config, use_callback=False):
@@ -356,14 +382,24 @@ class FileService:
                 
                 cb = tracker if use_callback else None
 
-                await self.storage_repo.upload_file(
-                    file_content=file_content,
-                    key=storage_key,
-                    content_type=stored_file.file_type, 
-                    provider=p_type,
-                    credentials=creds,
-                    progress_callback=cb
-                )
+                if temp_path is None:
+                    await self.storage_repo.upload_fileobj(
+                        fileobj=file.file,
+                        key=storage_key,
+                        content_type=stored_file.file_type,
+                        provider=p_type,
+                        credentials=creds,
+                        progress_callback=cb
+                    )
+                else:
+                    await self.storage_repo.upload_file_from_path(
+                        file_path=temp_path,
+                        key=storage_key,
+                        content_type=stored_file.file_type,
+                        provider=p_type,
+                        credentials=creds,
+                        progress_callback=cb
+                    )
                 
                 bucket_name = creds.bucket_name if creds else await self.storage_repo._get_bucket(p_type)
                 p_value = p_type.value if hasattr(p_type, 'value') else p_type
@@ -396,11 +432,12 @@ class FileService:
             
             # Set progress to 100%
             await self.duma_file_repo.update_upload_progress(file_id, 100)
+            await self.duma_file_repo.flush_progress()
             
-            logger.info(f"Background upload for file {file_id} completed successfully")
+            logger.info("Background upload completed", file_id=file_id)
 
         except Exception as e:
-            logger.error(f"Background upload failed for file {file_id}: {e}", exc_info=e)
+            logger.error("Background upload failed", file_id=file_id, error=str(e), exc_info=e)
             
             # Update status failed with error details
             error_msg = f"{type(e).__name__}: {str(e)}"
@@ -413,9 +450,9 @@ class FileService:
             if temp_path and os.path.exists(temp_path):
                 try:
                     os.remove(temp_path)
-                    logger.info(f"Cleaned up temp file: {temp_path}")
+                    logger.info("Cleaned up temp file", temp_path=temp_path)
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file {temp_path}: {e}")
+                    logger.warning("Failed to cleanup temp file", temp_path=temp_path, error=str(e))
 
     async def download_file(self, file_id: int, user_id: int) -> FileDownloadResponse:
         """
@@ -512,8 +549,9 @@ class FileService:
     ) -> FileListResponse:
         """List user's files with pagination."""
         skip = (page - 1) * page_size
-        files = await self.duma_file_repo.get_by_user_id(user_id, skip=skip, limit=page_size)
-        total = await self.duma_file_repo.get_file_count_by_user(user_id)
+        rows, total = await self.duma_file_repo.get_page_by_user_id(
+            user_id, skip=skip, limit=page_size
+        )
 
         total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
@@ -525,7 +563,7 @@ class FileService:
         # We need to map manually like in get_file_details.
         
         file_responses = []
-        for f in files:
+        for f in rows:
             # Determine provider helper (duplicate logic, could be refactored)
             provider = "unknown"
             if f.s3_url: provider = "aws_s3"
@@ -580,11 +618,13 @@ class FileService:
             storage_key, expiration=expiration
         )
 
+        # The storage layer may hand out a reused URL, so expires_in comes
+        # from the URL's own signing time rather than the requested expiration
         return FileDownloadResponse(
             file_id=file_record.id,
             filename=file_record.file_name,
             download_url=download_url,
-            expires_in=expiration,
+            expires_in=_url_expires_in(download_url, expiration),
             file_size=file_record.file_size,
             content_type=file_record.file_type,
         )
@@ -613,7 +653,7 @@ class FileService:
         
         logger = get_logger(__name__)
         
-        logger.info(f"Initiating direct upload for user {user_id}, file: {filename}")
+        logger.info("Initiating direct upload", user_id=user_id, filename=filename)
         
         # 1. Validate file size (content_type already validated by schema)
         from ..config import settings
@@ -693,7 +733,7 @@ class FileService:
                 dumapod_id, primary_storage
             )
             if not credentials:
-                logger.warning(f"Custom credentials not found for {primary_storage}")
+                logger.warning("Custom credentials not found", provider=primary_storage)
                 # Fall back to default credentials
         
         # 5. Generate presigned URL
@@ -701,6 +741,7 @@ class FileService:
             presigned_data = await self.storage_repo.generate_presigned_upload_url(
                 key=storage_key,
                 content_type=content_type,
+                # Signed so the upload can't exceed the size the quota check used
                 file_size=file_size,
                 expiration=3600,  # 1 hour
                 provider=primary_storage.value if hasattr(primary_storage, 'value') else primary_storage,
@@ -709,16 +750,16 @@ class FileService:
             
             return PresignedUploadResponse(
                 file_id=stored_file.id,
-                upload_url=presigned_data["upload_url"],
-                upload_method=presigned_data["method"],
-                upload_headers=presigned_data["headers"],
+                upload_url=presigned_data.upload_url,
+                upload_method=presigned_data.method,
+                upload_headers=presigned_data.headers,
                 expires_in=3600,
                 storage_key=storage_key,
                 storage_provider=primary_storage.value if hasattr(primary_storage, 'value') else primary_storage
             )
         except Exception as e:
             # Clean up database record if presigned URL generation fails
-            logger.error(f"Failed to generate presigned URL: {e}")
+            logger.error("Failed to generate presigned URL", error=str(e))
             await self.duma_file_repo.update_file_status_and_urls(
                 stored_file.id, "failed", failed_reason=f"Failed to generate upload URL: {str(e)}"
             )
@@ -741,7 +782,7 @@ class FileService:
         from ..utils.logger import get_logger
         logger = get_logger(__name__)
         
-        logger.info(f"Confirming upload for file {file_id}, user {user_id}")
+        logger.info("Confirming upload", file_id=file_id, user_id=user_id)
         
         # 1. Get file record
         file_record = await self.duma_file_repo.get_by_user_and_id(user_id, file_id)
@@ -753,7 +794,7 @@ class FileService:
         
         # Check if already completed
         if file_record.upload_status == "completed":
-            logger.info(f"File {file_id} already marked as completed")
+            logger.info("File already marked as completed", file_id=file_id)
             return await self.get_file_details(file_id, user_id)
         
         # Check if in correct status
@@ -776,7 +817,7 @@ class FileService:
         
         if not storage_key:
             # Fallback for old records without storage_key
-            logger.warning(f"File {file_id} has no storage_key, regenerating (may not match actual location)")
+            logger.warning("File has no storage_key, regenerating (may not match actual location)", file_id=file_id)
             storage_key = self.storage_repo.generate_key(user_id, file_record.file_name)
         
         logger.info(
@@ -792,18 +833,18 @@ class FileService:
             provider_value = primary_storage.value if hasattr(primary_storage, 'value') else primary_storage
             bucket = await self.storage_repo._get_bucket(provider_value)
             
-            logger.info(f"Checking in bucket: {bucket}, key: {storage_key}")
+            logger.info("Checking file existence", bucket=bucket, key=storage_key)
             
             exists = await self.storage_repo.file_exists(
                 key=storage_key,
                 provider=provider_value
             )
             
-            logger.info(f"File exists check result: {exists}")
+            logger.info("File exists check result", exists=exists)
             
             if not exists:
                 error_msg = f"File not found in storage. Bucket: {bucket}, Key: {storage_key}, Provider: {provider_value}"
-                logger.error(f"File {file_id} not found - {error_msg}")
+                logger.error("File not found in storage", file_id=file_id, error=error_msg)
                 await self.duma_file_repo.update_file_status_and_urls(
                     file_id, "failed", failed_reason=error_msg
                 )
@@ -814,7 +855,7 @@ class FileService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error checking file existence: {e}", exc_info=True)
+            logger.error("Error checking file existence", error=str(e), exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to verify file upload: {str(e)}"
@@ -844,8 +885,9 @@ class FileService:
         
         # Set progress to 100%
         await self.duma_file_repo.update_upload_progress(file_id, 100)
+        await self.duma_file_repo.flush_progress()
         
-        logger.info(f"Upload confirmed for file {file_id}")
+        logger.info("Upload confirmed", file_id=file_id)
         
         # 5. Return file details
         return await self.get_file_details(file_id, user_id)
@@ -896,40 +938,44 @@ class FileService:
         if part_size is None:
             part_size, total_parts = self.storage_repo.calculate_part_size(file_size)
         else:
-            import math
-            total_parts = math.ceil(file_size / part_size)
+            total_parts = -(-file_size // part_size)
         
-        # 4. Create database record
+        # 4. Initiate multipart upload in S3 and presign its parts. This does not
+        # depend on the database record, so it runs while the record is created.
         sanitized_filename = sanitize_filename(filename)
         storage_key = self.storage_repo.generate_key(user_id, sanitized_filename)
+        provider_value = primary_storage.value if hasattr(primary_storage, 'value') else primary_storage
         
-        stored_file = await self.duma_file_repo.create_file_record(
-            dumapod_id=dumapod_id,
-            user_id=user_id,
-            file_name=sanitized_filename,
-            file_type=content_type,
-            file_size=file_size,
-            storage_key=storage_key,
-            upload_status="pending_multipart"
-        )
+        upload_task = asyncio.ensure_future(self.storage_repo.begin_multipart_upload(
+            key=storage_key,
+            content_type=content_type,
+            total_parts=total_parts,
+            provider=provider_value
+        ))
         
-        # 5. Initiate multipart upload in S3
+        # 5. Create database record
         try:
-            provider_value = primary_storage.value if hasattr(primary_storage, 'value') else primary_storage
-            
-            upload_id = await self.storage_repo.initiate_multipart_upload(
-                key=storage_key,
-                content_type=content_type,
-                provider=provider_value
-            )
-            
-            # 6. Generate presigned URLs for all parts
-            parts_data = await self.storage_repo.generate_multipart_presigned_urls(
-                key=storage_key,
-                upload_id=upload_id,
-                total_parts=total_parts,
-                provider=provider_value
+            stored_file = await self.duma_file_repo.create_file_record(
+                dumapod_id=dumapod_id,
+                user_id=user_id,
+                file_name=sanitized_filename,
+                file_type=content_type,
+                file_size=file_size,
+                storage_key=storage_key,
+                upload_status="pending_multipart"
             )
+        except Exception:
+            # Don't leave an untracked multipart upload behind in storage
+            try:
+                upload_id, _ = await upload_task
+                await self.storage_repo.abort_multipart_upload(storage_key, upload_id, provider=provider_value)
+            except Exception:
+                pass
+            raise
+        
+        try:
+            # 6. Wait for the upload id and part URLs
+            upload_id, parts_data = await upload_task
             
             # 7. Update database with multipart info
             from sqlalchemy import text
@@ -964,7 +1010,7 @@ class FileService:
             )
             
         except Exception as e:
-            logger.error(f"Failed to initiate multipart upload: {e}")
+            logger.error("Failed to initiate multipart upload", error=str(e))
             await self.duma_file_repo.update_file_status_and_urls(
                 stored_file.id, "failed", failed_reason=str(e)
             )
@@ -1049,7 +1095,7 @@ class FileService:
             )
             
         except Exception as e:
-            logger.error(f"Failed to complete multipart upload: {e}")
+            logger.error("Failed to complete multipart upload", error=str(e))
             await self.duma_file_repo.update_file_status_and_urls(
                 file_id, "failed", failed_reason=str(e)
             )
@@ -1105,7 +1151,7 @@ class FileService:
             return {"message": "Multipart upload aborted successfully"}
             
         except Exception as e:
-            logger.error(f"Failed to abort multipart upload: {e}")
+            logger.error("Failed to abort multipart upload", error=str(e))
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to abort multipart upload: {str(e)}"
@@ -1137,7 +1183,7 @@ async def run_background_upload_wrapper(
             await session.commit()
         except Exception as e:
             await session.rollback()
-            logger.error(f"Critical error in background upload wrapper for file {file_id}: {e}", exc_info=e)
+            logger.error("Critical error in background upload wrapper", file_id=file_id, error=str(e), exc_info=e)
             # Try to update status to failed with error details
             error_msg = f"{type(e).__name__}: {str(e)}"
             try:
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.subscription_repo import SubscriptionRepository
 from ..repositories.user_repo import UserRepository
 from ..config.stripe import stripe_client
+from ..middleware.quota import invalidate_subscription_cache
 from ..schemas.subscription import PlanSchema, SubscriptionCreate, SubscriptionResponse, QuotaStatus
 from ..utils.helpers import bytes_to_gb
 
@@ -65,6 +66,7 @@ class SubscriptionService:
             plan_id=subscription_data.plan_id,
             stripe_subscription_id=stripe_subscription_id,
         )
+        await invalidate_subscription_cache(user_id)
 
         return SubscriptionResponse(
             id=subscription["id"],
@@ -93,13 +95,13 @@ class SubscriptionService:
                 detail="No active subscription found",
             )
 
-        storage_limit = subscription["storage_limit_gb"]
-        used_storage = subscription["used_storage_gb"]
+        storage_limit = subscription.storage_limit_gb
+        used_storage = subscription.used_storage_gb
         available_storage = storage_limit - used_storage
         storage_percentage = (used_storage / storage_limit * 100) if storage_limit > 0 else 0
 
-        file_limit = subscription["file_limit"]
-        used_files = subscription["used_file_count"]
+        file_limit = subscription.file_limit
+        used_files = subscription.used_file_count
         available_files = file_limit - used_files
         file_percentage = (used_files / file_limit * 100) if file_limit > 0 else 0
 
@@ -122,8 +124,9 @@ class SubscriptionService:
         if subscription:
             storage_gb = bytes_to_gb(storage_bytes)
             await self.subscription_repo.update_quota(
-                subscription["id"], storage_gb=storage_gb, file_count=file_count
+                subscription, storage_gb=storage_gb, file_count=file_count
             )
+            await invalidate_subscription_cache(user_id)
 
     async def handle_stripe_webhook(self, event_data: dict) -> dict:
         """Handle Stripe webhook events."""
@@ -8,7 +8,7 @@ from sqlalchemy.orm import selectinload
 from ..repositories.user_repo import UserRepository
 from ..repositories.duma_stored_file_repo import DumaStoredFileRepository
 from ..schemas.user import UserCreate, UserUpdate, UserWithUsageResponse, UserPodUsage
-from ..core.security import get_password_hash
+from ..core.security import get_password_hash_async
 from ..models.user import User
 from ..utils.helpers import bytes_to_gb
 
@@ -33,14 +33,13 @@ class UserService:
 
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user (admin function)."""
-        existing_user = await self.user_repo.get_by_email(user_data.email)
-        if existing_user:
+        if await self.user_repo.email_exists(user_data.email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         return await self.user_repo.create_user(
             email=user_data.email,
             hashed_password=hashed_password,
@@ -54,7 +53,7 @@ class UserService:
         
         data = user_data.model_dump(exclude_unset=True)
         if "password" in data:
-            data["hashed_password"] = get_password_hash(data.pop("password"))
+            data["hashed_password"] = await get_password_hash_async(data.pop("password"))
             
         return await self.user_repo.update_user(user, data)
 
@@ -87,9 +86,8 @@ class UserService:
         for user in users:
             pods_usage = []
             for pod in user.created_dumapods:
-                used_bytes = await self.file_repo.get_total_usage(pod.id)
+                used_bytes, file_count = await self.file_repo.get_usage_summary(pod.id)
                 used_gb = round(bytes_to_gb(float(used_bytes) if used_bytes else 0.0), 4)
-                file_count = await self.file_repo.get_file_count(pod.id)
                 
                 balance_gb = round(float(pod.storage_capacity_gb) - used_gb, 4)
                 
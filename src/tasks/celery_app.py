@@ -8,7 +8,7 @@ celery_app = Celery(
     "dumacle",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=["src.tasks.transcoding", "src.tasks.quota_reset"],
+    include=["src.tasks.transcoding", "src.tasks.quota_reset", "src.tasks.webhooks"],
 )
 
 # Celery configuration
@@ -0,0 +1,70 @@
+"""Webhook processing Celery tasks."""
+
+import asyncio
+import json
+from ..tasks.celery_app import celery_app
+from ..config.database import AsyncSessionLocal
+from ..config.redis import redis_client
+
+# Stripe retries failed deliveries for up to three days
+STRIPE_EVENT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Exponential backoff from 1 minute, capped at 6 hours; 20 retries span about
+# 74 hours, so a failing event is retried at least as long as Stripe would
+STRIPE_RETRY_BASE_SECONDS = 60
+STRIPE_RETRY_MAX_SECONDS = 6 * 60 * 60
+STRIPE_MAX_RETRIES = 20
+
+
+def stripe_event_key(event_id: str) -> str:
+    """Redis key holding the raw body of a received Stripe event."""
+    return f"stripe:event:{event_id}"
+
+
+def stripe_event_processed_key(event_id: str) -> str:
+    """Redis key marking a Stripe event as applied."""
+    return f"stripe:event:{event_id}:processed"
+
+
+@celery_app.task(name="process_stripe_event", bind=True, max_retries=STRIPE_MAX_RETRIES)
+def process_stripe_event(self, event_id: str) -> dict:
+    """
+    Apply a verified Stripe event stored by the webhook endpoint.
+    The event is marked processed after its changes commit; already processed
+    events are skipped, so redelivered events are applied once.
+    """
+    # Imported here to avoid circular imports
+    from ..services.subscription_service import SubscriptionService
+
+    processed_key = stripe_event_processed_key(event_id)
+    if redis_client.exists(processed_key):
+        return {"event_id": event_id, "status": "duplicate"}
+
+    raw_event = redis_client.get(stripe_event_key(event_id))
+    if raw_event is None:
+        return {"event_id": event_id, "status": "expired"}
+
+    event = json.loads(raw_event)
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def _process() -> dict:
+        async with AsyncSessionLocal() as session:
+            result = await SubscriptionService(session).handle_stripe_webhook(event)
+            await session.commit()
+            return result
+
+    try:
+        result = loop.run_until_complete(_process())
+    except Exception as exc:
+        countdown = min(
+            STRIPE_RETRY_BASE_SECONDS * 2 ** self.request.retries,
+            STRIPE_RETRY_MAX_SECONDS,
+        )
+        raise self.retry(exc=exc, countdown=countdown)
+    finally:
+        loop.close()
+
+    redis_client.set(processed_key, "1", ex=STRIPE_EVENT_TTL_SECONDS)
+    return result
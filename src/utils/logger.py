@@ -4,6 +4,7 @@ import logging
 import sys
 from pathlib import Path
 from typing import Any
+import orjson
 import structlog
 from ..config import settings
 
@@ -14,27 +15,39 @@ log_dir.mkdir(exist_ok=True)
 
 def configure_logging() -> None:
     """Configure structured logging with structlog."""
+    log_level = getattr(logging, settings.log_level.upper())
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper()),
+        level=log_level,
     )
 
-    # Configure structlog
+    # Production logs are rendered straight to bytes by orjson
+    if settings.debug:
+        renderer = structlog.dev.ConsoleRenderer()
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        logger_factory = structlog.BytesLoggerFactory()
+
+    # Configure structlog. The filtering bound logger drops calls below the
+    # configured level before any processor runs, and caching binds each
+    # module's logger once instead of on every call.
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer(),
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            renderer,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
     )
 
 
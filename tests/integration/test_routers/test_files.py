@@ -28,3 +28,16 @@ async def test_health_check(client: AsyncClient):
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_upload_rejects_oversized_content_length(client: AsyncClient):
+    """Test that oversized uploads are rejected from Content-Length before auth."""
+    from src.config import settings
+
+    too_large = settings.max_file_size_bytes * 2
+    response = await client.post(
+        "/files/upload", headers={"Content-Length": str(too_large)}
+    )
+    assert response.status_code == 413
@@ -0,0 +1,127 @@
+"""Unit tests for the stored-file repository's usage counter and progress buffer."""
+
+import asyncio
+
+import pytest
+
+from src.models.dumapod import DumaPod
+from src.models.user import User, UserRole
+from src.repositories import duma_stored_file_repo
+from src.repositories.duma_stored_file_repo import DumaStoredFileRepository
+
+
+@pytest.fixture
+async def pod(db_session):
+    user = User(
+        email="owner@example.com",
+        hashed_password="x",
+        full_name="Owner",
+        role=UserRole.ADMIN,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    pod = DumaPod(name="usage-pod", storage_capacity_gb=1, created_by=user.id)
+    db_session.add(pod)
+    await db_session.commit()
+    return pod
+
+
+async def _usage(repo: DumaStoredFileRepository, pod: DumaPod) -> int:
+    return await repo.get_total_usage(pod.id)
+
+
+async def _create(repo: DumaStoredFileRepository, pod: DumaPod, size: int, status: str = "uploading"):
+    return await repo.create_file_record(
+        dumapod_id=pod.id,
+        user_id=pod.created_by,
+        file_name=f"file-{size}.bin",
+        file_type="application/octet-stream",
+        file_size=size,
+        upload_status=status,
+    )
+
+
+async def test_create_counts_file_unless_failed(db_session, pod):
+    repo = DumaStoredFileRepository(db_session)
+
+    await _create(repo, pod, 100)
+    await _create(repo, pod, 50, status="failed")
+
+    assert await _usage(repo, pod) == 100
+
+
+async def test_status_transitions_adjust_usage_once(db_session, pod):
+    repo = DumaStoredFileRepository(db_session)
+    record = await _create(repo, pod, 100)
+
+    await repo.update_file_status_and_urls(record.id, "failed")
+    assert await _usage(repo, pod) == 0
+
+    # Repeating the same status must not subtract again
+    await repo.update_file_status_and_urls(record.id, "failed")
+    assert await _usage(repo, pod) == 0
+
+    await repo.update_file_status_and_urls(record.id, "completed")
+    assert await _usage(repo, pod) == 100
+
+    await repo.update_file_status_and_urls(record.id, "completed")
+    assert await _usage(repo, pod) == 100
+
+
+async def test_recompute_usage_repairs_drift(db_session, pod):
+    repo = DumaStoredFileRepository(db_session)
+    await _create(repo, pod, 100)
+    await _create(repo, pod, 30, status="failed")
+
+    pod.usage_bytes = 12345
+    await db_session.commit()
+
+    assert await repo.recompute_usage(pod.id) == 100
+    assert await _usage(repo, pod) == 100
+
+
+class _RecordingSession:
+    """Stands in for a session; records progress writes once its gate opens."""
+
+    def __init__(self, gate: asyncio.Event, writes: list):
+        self.gate = gate
+        self.writes = writes
+
+    async def __aenter__(self):
+        await self.gate.wait()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+    async def execute(self, statement, params):
+        self.writes.extend(p["progress"] for p in params)
+
+
+async def test_flush_progress_never_commits_stale_value_last(monkeypatch):
+    writes = []
+    slow_checkout = asyncio.Event()
+    open_gate = asyncio.Event()
+    open_gate.set()
+    gates = iter([slow_checkout, open_gate])
+    monkeypatch.setattr(
+        duma_stored_file_repo, "AsyncSessionLocal", lambda: _RecordingSession(next(gates), writes)
+    )
+    monkeypatch.setattr(duma_stored_file_repo, "_progress_buffer", {})
+
+    # A background flush snapshots 95 and waits on connection checkout...
+    duma_stored_file_repo._progress_buffer[1] = 95
+    background = asyncio.create_task(DumaStoredFileRepository.flush_progress())
+    await asyncio.sleep(0)
+
+    # ...while the completion path records 100 and flushes explicitly
+    duma_stored_file_repo._progress_buffer[1] = 100
+    completion = asyncio.create_task(DumaStoredFileRepository.flush_progress())
+    await asyncio.sleep(0)
+    slow_checkout.set()
+    await asyncio.gather(background, completion)
+
+    assert writes == [95, 100]
@@ -0,0 +1,120 @@
+"""Unit tests for the direct SigV4 presigners in the storage repository."""
+
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import boto3
+import botocore.auth
+import pytest
+from botocore.config import Config
+
+from src.repositories import storage_repo
+
+FROZEN_NOW = datetime(2026, 3, 14, 15, 9, 26, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz else FROZEN_NOW.replace(tzinfo=None)
+
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    """Give botocore and the direct signers the same timestamp."""
+    monkeypatch.setattr(storage_repo, "datetime", _FrozenDatetime)
+    if hasattr(botocore.auth, "get_current_datetime"):
+        monkeypatch.setattr(
+            botocore.auth, "get_current_datetime", lambda *args, **kwargs: FROZEN_NOW.replace(tzinfo=None)
+        )
+    else:
+        monkeypatch.setattr(botocore.auth.datetime, "datetime", _FrozenDatetime)
+
+
+CLIENTS = {
+    "aws-us-east-1": dict(region_name="us-east-1"),
+    "aws-eu-west-2": dict(region_name="eu-west-2"),
+    "wasabi": dict(region_name="us-east-1", endpoint_url="https://s3.wasabisys.com"),
+    "oracle": dict(
+        region_name="us-ashburn-1",
+        endpoint_url="https://ns.compat.objectstorage.us-ashburn-1.oraclecloud.com",
+    ),
+}
+
+KEYS = [
+    "simple.bin",
+    "1/2024/a b+c/ü file(1).mp4",
+    "x/~y*z'!;:@&=$,?#[]%",
+]
+
+
+def _client(name: str, addressing_style: str, token):
+    return boto3.client(
+        "s3",
+        aws_access_key_id="AKIDEXAMPLE",
+        aws_secret_access_key="secret/Key+1",
+        aws_session_token=token,
+        config=Config(signature_version="s3v4", s3={"addressing_style": addressing_style}),
+        **CLIENTS[name],
+    )
+
+
+def _assert_same_url(expected: str, actual: str) -> None:
+    e, a = urlsplit(expected), urlsplit(actual)
+    assert (a.scheme, a.netloc, a.path) == (e.scheme, e.netloc, e.path)
+    assert parse_qs(a.query) == parse_qs(e.query)
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("token", [None, "session/tok+en=="])
+@pytest.mark.parametrize("addressing_style", ["virtual", "path"])
+@pytest.mark.parametrize("client_name", list(CLIENTS))
+def test_sign_get_object_matches_botocore(client_name, addressing_style, token, key):
+    """Direct get_object URLs are identical to botocore's."""
+    client = _client(client_name, addressing_style, token)
+
+    expected = client.generate_presigned_url(
+        "get_object", Params={"Bucket": "my-bucket", "Key": key}, ExpiresIn=3600
+    )
+    actual = storage_repo._sign_get_object(client, "my-bucket", key, 3600)
+
+    _assert_same_url(expected, actual)
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("token", [None, "session/tok+en=="])
+@pytest.mark.parametrize("addressing_style", ["virtual", "path"])
+@pytest.mark.parametrize("client_name", list(CLIENTS))
+def test_sign_upload_parts_matches_botocore(client_name, addressing_style, token, key):
+    """Directly signed upload_part URLs are identical to botocore's."""
+    client = _client(client_name, addressing_style, token)
+    upload_id = "up/load+id=="
+
+    parts = storage_repo._sign_upload_parts(client, "my-bucket", key, upload_id, 1, 12, 3600)
+
+    assert [p["part_number"] for p in parts] == list(range(1, 12))
+    for part in parts:
+        expected = storage_repo._presign_upload_part(
+            client, "my-bucket", key, upload_id, part["part_number"], 3600
+        )
+        _assert_same_url(expected, part["upload_url"])
+
+
+def test_signers_fall_back_to_botocore_without_credentials(monkeypatch):
+    """Unreadable client credentials fall back to botocore presigning."""
+    client = _client("aws-us-east-1", "virtual", None)
+    monkeypatch.setattr(storage_repo, "_client_credentials", lambda client: None)
+
+    expected = client.generate_presigned_url(
+        "get_object", Params={"Bucket": "my-bucket", "Key": "a.bin"}, ExpiresIn=3600
+    )
+    _assert_same_url(expected, storage_repo._sign_get_object(client, "my-bucket", "a.bin", 3600))
+
+    parts = storage_repo._sign_upload_parts(client, "my-bucket", "a.bin", "u", 1, 3, 3600)
+    for part in parts:
+        expected = storage_repo._presign_upload_part(client, "my-bucket", "a.bin", "u", part["part_number"], 3600)
+        _assert_same_url(expected, part["upload_url"])